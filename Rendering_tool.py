@@ -7,9 +7,10 @@
 from prompt_toolkit import prompt
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.shortcuts import clear
-import subprocess
+import sys
 import os
 import time
+import numpy as np
 
 title ="""
 ____________  ___  _____ _____ ___  _      ______ _____ _   _______ ___________ ___________ 
@@ -100,23 +101,22 @@ def cast_to_string(input_str):
     return input_str
 
 def cast_to_tuple(input_str):
+    # np.fromstring parses the whole comma-separated list in one C call
     try:
-        temp = tuple(map(int, input_str.split(',')))
-        if len(temp) != 2: return None
-        return temp
+        temp = np.fromstring(input_str, sep=',', dtype=np.int64)
     except ValueError:
-        return 
+        return None
+    if temp.size != 2: return None
+    return tuple(temp.tolist())
 
 def cast_to_range_tuple(input_str):
+    # np.fromstring parses the whole comma-separated list in one C call
     try:
-        temp = tuple(map(float, input_str.split(',')))
-    except:
-        try:
-            temp = tuple(map(int, input_str.split(',')))
-        except ValueError:
-            return None
-    if len(temp) != 4: return None
-    return temp
+        temp = np.fromstring(input_str, sep=',')
+    except ValueError:
+        return None
+    if temp.size != 4: return None
+    return tuple(temp.tolist())
 
 cast_functions = {
     'const': cast_to_complex,
@@ -178,14 +178,35 @@ f'Enter new value for {selected} (or type "cancel" to discard)\n\
         print(f'{selected} option not recognized')
     return True
 
+# cached renderer instance ([] for closure, like index above)
+# rendering in-process means the heavy numpy/matplotlib/sympy imports and
+# the numba kernel compilation are paid once, not on every RENDER click
+renderer = [None]
+
 def render(values):
-    script_path = os.path.join(os.getcwd(), "Utils", "Renderers_still_in_development", "Julia_sets_renderers.py")
-    command = ["python", script_path, str(values['const']), str(values['map']), str(values['resolution']), str(values['range'])]
+    renderer_dir = os.path.join(os.getcwd(), "Utils", "Renderers_still_in_development")
+    if renderer_dir not in sys.path:
+        sys.path.insert(0, renderer_dir)
 
     try:
-        subprocess.call(command)
-    except subprocess.CalledProcessError as e:
-        print("Error running the script:", e)
+        from Julia_sets_renderers import Julia2png
+
+        if renderer[0] is None:
+            renderer[0] = Julia2png(atractor="z^2+const", const=values['const'], \
+                                    maps=["plt " + values['map']], \
+                                    resolution_w=values['resolution'][0], \
+                                    resolution_h=values['resolution'][1], \
+                                    range=values['range'])
+        else:
+            renderer[0].update_parameters(const=values['const'], \
+                                          resolution_w=values['resolution'][0], \
+                                          resolution_h=values['resolution'][1], \
+                                          range=values['range'])
+            renderer[0].maps = ["plt " + values['map']]
+
+        renderer[0].render()
+    except Exception as e:
+        print("Error running the renderer:", e)
 
 def main():
     continue_flag = True
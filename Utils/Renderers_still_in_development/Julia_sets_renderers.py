@@ -31,12 +31,14 @@
 
 # IMPORTS
 import re                                       # regular expressions (file name string creation)
-import os                                       # path 
+import os                                       # path
 import math                                     # sqrt
+from concurrent.futures import ProcessPoolExecutor # parallel GIF frame rendering
+from concurrent.futures import ThreadPoolExecutor  # parallel tile rendering
+import multiprocessing                             # spawn context for the GIF pools
 import time                                     # measuring time of rendering
 import numpy as np                              # array manipulation
 from PIL import Image                           # image manipulation
-from functools import reduce                    # file name string creation
 import matplotlib.pyplot as plt                 # colormaps
 # adding path to sys paths so loading bar would import when script called as subprocess
 import sys
@@ -46,6 +48,355 @@ if script_dir not in sys.path:
 from loading_bar import LoadingBar              # loading bar
 from PIL import PngImagePlugin as pip           # image metadata
 from sympy import sympify, lambdify, symbols    # sympy expression for atractor
+# numba is optional, without it the default atractor uses a pure NumPy kernel
+try:
+    from numba import njit, prange                  # JIT compiled escape-time kernel
+    from numba import guvectorize, float64, int64   # row-at-a-time escape-time kernel
+    from numba import uint8, uint16                 # output types of the row kernel
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# a CUDA capable GPU is optional as well
+try:
+    from numba import cuda                          # GPU escape-time kernel
+    CUDA_AVAILABLE = NUMBA_AVAILABLE and cuda.is_available()
+except Exception:
+    CUDA_AVAILABLE = False
+
+# optional ahead-of-time compiled kernel (build with: python julia_aot.py),
+# skips the JIT warmup that dominates short single-image renders from the CLI
+try:
+    import _julia_ext                               # AOT escape-time kernel
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
+
+# ESCAPE-TIME KERNELS
+# Compiled machine code for the default atractor f(z) = z^2 + const,
+# other atractors keep using the sympy based paths.
+# cache=True persists the compiled code between runs.
+if NUMBA_AVAILABLE:
+
+    # fastmath relaxes IEEE ordering so LLVM can fuse and vectorize the
+    # multiplies (FMA + AVX2/AVX-512 where available), error_model='numpy'
+    # drops the division-by-zero guards. With Intel SVML installed (icc-rt)
+    # numba picks it up automatically, NUMBA_ENABLE_AVX512=1 can widen
+    # the vectors further on capable CPUs.
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True, error_model='numpy')
+    def _julia_kernel(re_min, re_max, im_min, im_max, c_re, c_im, max_iter, max_mag, out):
+        '''
+        Fills out with amounts of iterations till exceeding max_mag
+        (or max_iter-1 if not exceeded) for the atractor f(z) = z^2 + const.
+
+        Operates on passed out array !!!
+
+        Parameters:
+        - re_min, re_max, im_min, im_max: range of complex numbers (float)
+        - c_re, c_im: real and imaginary part of the constant (float)
+        - max_iter: maximum amount of iterations (int)
+        - max_mag: maximum magnitude of complex number (float)
+        - out: preallocated (res_h, res_w) array to populate (np.array)
+        '''
+        h, w = out.shape
+        dx = (re_max - re_min) / w
+        dy = (im_max - im_min) / h
+        mag2 = max_mag * max_mag
+
+        # rows are independent, prange distributes them across all cores
+        for y in prange(h):
+            im_z = im_min + y * dy
+            for x in range(w):
+                # same mapping as pixel2complex
+                zr = re_min + x * dx
+                zi = im_z
+
+                # same semantics as if_in_julia_set
+                count = max_iter - 1
+                for n in range(max_iter):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    zi = 2.0 * zr * zi + c_im
+                    zr = zr2 - zi2 + c_re
+                    if zr * zr + zi * zi > mag2:
+                        count = n
+                        break
+                out[y, x] = count
+
+
+    # Row-at-a-time variant of _julia_kernel as a gufunc, numba threads the rows
+    # itself (target='parallel') and emits a SIMD friendly inner loop.
+    # Compiled lazily on first call - an explicit signature list at module
+    # scope would compile on import, and initializing numba's parallel
+    # threading layer as an import side effect breaks fork safety for
+    # every downstream user of this module.
+    def _julia_row_source(re_row, im_z, c_re, c_im, max_iter, max_mag, out):
+        '''
+        Fills one row of orbits for the atractor f(z) = z^2 + const.
+        Broadcast over a column of im_z values to fill a whole image,
+        same escape semantics as _julia_kernel.
+        '''
+        mag2 = max_mag * max_mag
+        for x in range(re_row.shape[0]):
+            zr = re_row[x]
+            zi = im_z
+
+            count = max_iter - 1
+            for n in range(max_iter):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                zi = 2.0 * zr * zi + c_im
+                zr = zr2 - zi2 + c_re
+                if zr * zr + zi * zi > mag2:
+                    count = n
+                    break
+            out[x] = count
+
+    _julia_row_compiled = None
+
+    def _julia_row(*args):
+        '''Compiles the row gufunc on first call and forwards to it.'''
+        global _julia_row_compiled
+        if _julia_row_compiled is None:
+            _julia_row_compiled = guvectorize( \
+                [(float64[:], float64, float64, float64, int64, float64, uint8[:]),
+                 (float64[:], float64, float64, float64, int64, float64, uint16[:])],
+                '(n),(),(),(),(),()->(n)', target='parallel', fastmath=True, cache=True) \
+                (_julia_row_source)
+        return _julia_row_compiled(*args)
+
+
+# One thread per pixel GPU variant of _julia_kernel
+# (defined only when a CUDA capable GPU is present, cuda.jit would fail otherwise)
+if CUDA_AVAILABLE:
+
+    @cuda.jit
+    def _julia_kernel_cuda(re_min, dx, im_min, dy, c_re, c_im, max_iter, mag2, out):
+        '''
+        Fills device array out with orbits of the atractor f(z) = z^2 + const,
+        same escape semantics as _julia_kernel.
+        Launch with a 2D grid covering the (res_h, res_w) shape of out.
+        '''
+        x, y = cuda.grid(2)
+        h, w = out.shape
+        if x >= w or y >= h:
+            return
+
+        # same mapping as pixel2complex
+        zr = re_min + x * dx
+        zi = im_min + y * dy
+
+        count = max_iter - 1
+        for n in range(max_iter):
+            zr2 = zr * zr
+            zi2 = zi * zi
+            zi = 2.0 * zr * zi + c_im
+            zr = zr2 - zi2 + c_re
+            if zr * zr + zi * zi > mag2:
+                count = n
+                break
+        out[y, x] = count
+
+
+# Pure NumPy fallback with the same contract as _julia_kernel, iteration happens
+# max_iter times on whole arrays with a mask of not-yet-diverged pixels.
+# z is kept as separate real/imag arrays (structure-of-arrays) instead of
+# complex128 - half the memory traffic per iteration, float32 halves it again.
+def _julia_numpy(re_min, re_max, im_min, im_max, c_re, c_im, max_iter, max_mag, out, dtype=np.float64):
+    '''
+    Fills out with amounts of iterations till exceeding max_mag
+    (or max_iter-1 if not exceeded) for the atractor f(z) = z^2 + const.
+    NumPy fallback for environments without numba.
+
+    Operates on passed out array !!!
+
+    dtype selects the working precision of the z arrays
+    (np.float32 halves the bandwidth at reduced deep-zoom precision).
+    '''
+    h, w = out.shape
+    dx = (re_max - re_min) / w
+    dy = (im_max - im_min) / h
+
+    # real and imaginary parts of pixels as separate flat arrays
+    # (same mapping as pixel2complex), flat so they can be compacted below
+    zr = np.empty((h, w), dtype=dtype)
+    zr[:] = (re_min + np.arange(w) * dx)[np.newaxis, :]
+    zr = zr.reshape(-1)
+    zi = np.empty((h, w), dtype=dtype)
+    zi[:] = (im_min + np.arange(h) * dy)[:, np.newaxis]
+    zi = zi.reshape(-1)
+    c_re = dtype(c_re)
+    c_im = dtype(c_im)
+    mag2 = dtype(max_mag * max_mag)
+
+    # escape counts accumulate in a contiguous scratch array and get copied
+    # into out once at the end - reshape(-1) on out itself would silently
+    # return (and write into) a copy when out is a non-contiguous tile view
+    counts = np.full(h * w, max_iter - 1, dtype=out.dtype)
+    active_idx = np.arange(h * w) # flat pixel indices the z arrays refer to
+    mask = np.ones(h * w, dtype=bool)
+    for n in range(max_iter):
+        # advance only the not-yet-diverged pixels with hand-expanded complex math
+        zr_m = zr[mask]
+        zi_m = zi[mask]
+        zr2 = zr_m * zr_m
+        zi2 = zi_m * zi_m
+        zi[mask] = 2.0 * zr_m * zi_m + c_im
+        zr[mask] = zr2 - zi2 + c_re
+
+        # record the escape iteration of newly diverged pixels
+        diverged = mask & (zr * zr + zi * zi > mag2)
+        counts[active_idx[diverged]] = n
+        mask &= ~diverged
+
+        # once everything escaped there is nothing left to iterate
+        remaining = np.count_nonzero(mask)
+        if remaining == 0:
+            break
+
+        # every 16 iterations shrink the working arrays to the still-active
+        # pixels, per-iteration cost then scales with the active set instead
+        # of the full image (only worth it once the mask got sparse enough)
+        if (n & 15) == 15 and remaining < mask.size // 2:
+            active_idx = active_idx[mask]
+            zr = zr[mask]
+            zi = zi[mask]
+            mask = np.ones(remaining, dtype=bool)
+
+    out[:] = counts.reshape(h, w)
+
+
+# Prints the real and imaginary part of an atractor expression as python source
+def _atractor_re_im_src(atractor:str) -> tuple:
+    '''
+    Splits the atractor expression into its real and imaginary parts with
+    sympy and prints both back as plain float arithmetic over the variables
+    zr, zi, cr, ci, ar, ai, br, bi, dr, di. Raises when sympy cannot
+    resolve the split.
+    '''
+    from sympy import I, re as sym_re, im as sym_im
+    from sympy.printing.pycode import pycode
+
+    # substitute all complex parameters with explicit real/imag symbols
+    z, const, a, b, c = symbols('z const a b c')
+    zr, zi, cr, ci, ar, ai, br, bi, dr, di = \
+        symbols('zr zi cr ci ar ai br bi dr di', real=True)
+    expr = sympify(atractor).subs({z: zr + I*zi, const: cr + I*ci, \
+                                   a: ar + I*ai, b: br + I*bi, c: dr + I*di})
+    expr = expr.expand(complex=True)
+
+    return pycode(sym_re(expr)), pycode(sym_im(expr))
+
+
+# Characters forbidden in file names, compiled once for all file_path calls
+_forbidden_chars = re.compile(r'[~\\/:"*?<>|] ')
+
+
+# Cache of generated per-atractor kernels keyed by the atractor string
+# (None marks expressions that could not be compiled)
+_atractor_kernel_cache = {}
+
+def _compile_atractor_kernel(atractor:str):
+    '''
+    Generates a compiled escape-time kernel specialized for the given
+    atractor expression.
+
+    The expression is split into its real and imaginary parts with sympy,
+    printed back to python source as plain float arithmetic and exec'd into
+    the same loop shape as _julia_kernel, which numba then JIT compiles.
+    That removes both the sympy lambdify trampoline and all complex-array
+    temporaries from the iteration loop.
+
+    Returns None when the expression cannot be turned into machine code
+    (caller falls back to the sympy based path), kernels are cached
+    per atractor string.
+    '''
+    if not NUMBA_AVAILABLE:
+        return None
+    if atractor in _atractor_kernel_cache:
+        return _atractor_kernel_cache[atractor]
+
+    kernel = None
+    try:
+        re_src, im_src = _atractor_re_im_src(atractor)
+
+        # same loop shape, mapping and escape semantics as _julia_kernel
+        src = "def kernel(re_min, re_max, im_min, im_max, " + \
+                         "cr, ci, ar, ai, br, bi, dr, di, max_iter, max_mag, out):\n" + \
+              "    h, w = out.shape\n" + \
+              "    dx = (re_max - re_min) / w\n" + \
+              "    dy = (im_max - im_min) / h\n" + \
+              "    mag2 = max_mag * max_mag\n" + \
+              "    for y in prange(h):\n" + \
+              "        im_z = im_min + y * dy\n" + \
+              "        for x in range(w):\n" + \
+              "            zr = re_min + x * dx\n" + \
+              "            zi = im_z\n" + \
+              "            count = max_iter - 1\n" + \
+              "            for n in range(max_iter):\n" + \
+             f"                zr, zi = ({re_src}), ({im_src})\n" + \
+              "                if zr * zr + zi * zi > mag2:\n" + \
+              "                    count = n\n" + \
+              "                    break\n" + \
+              "            out[y, x] = count\n"
+        namespace = {'prange': prange, 'math': math}
+        exec(src, namespace)
+        kernel = njit(parallel=True, fastmath=True)(namespace['kernel'])
+
+        # force compilation on a 1x1 image so failures surface here, not mid-render
+        kernel(0.0, 1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, \
+               1, 2.0, np.zeros((1, 1), dtype=np.uint8))
+    except Exception:
+        kernel = None
+
+    _atractor_kernel_cache[atractor] = kernel
+    return kernel
+
+
+# Cache of generated per-atractor CUDA kernels (None marks failures)
+_atractor_kernel_cuda_cache = {}
+
+def _compile_atractor_kernel_cuda(atractor:str):
+    '''
+    CUDA variant of _compile_atractor_kernel, one thread per pixel with the
+    escape loop running register-resident on the GPU.
+
+    Returns None without a CUDA capable GPU or when the expression cannot
+    be compiled (caller falls back to the CPU paths).
+    '''
+    if not CUDA_AVAILABLE:
+        return None
+    if atractor in _atractor_kernel_cuda_cache:
+        return _atractor_kernel_cuda_cache[atractor]
+
+    kernel = None
+    try:
+        re_src, im_src = _atractor_re_im_src(atractor)
+
+        # same per-pixel escape semantics as _julia_kernel_cuda
+        src = "def kernel(re_min, dx, im_min, dy, " + \
+                         "cr, ci, ar, ai, br, bi, dr, di, max_iter, mag2, out):\n" + \
+              "    x, y = cuda.grid(2)\n" + \
+              "    h, w = out.shape\n" + \
+              "    if x < w and y < h:\n" + \
+              "        zr = re_min + x * dx\n" + \
+              "        zi = im_min + y * dy\n" + \
+              "        count = max_iter - 1\n" + \
+              "        for n in range(max_iter):\n" + \
+             f"            zr, zi = ({re_src}), ({im_src})\n" + \
+              "            if zr * zr + zi * zi > mag2:\n" + \
+              "                count = n\n" + \
+              "                break\n" + \
+              "        out[y, x] = count\n"
+        namespace = {'cuda': cuda, 'math': math}
+        exec(src, namespace)
+        kernel = cuda.jit(namespace['kernel'])
+    except Exception:
+        kernel = None
+
+    _atractor_kernel_cuda_cache[atractor] = kernel
+    return kernel
 
 
 # PARENT CLASS FOR RENDERING JULIA SETS
@@ -99,13 +450,27 @@ class JuliaSetRenderer:
         - map_slow2fast (maps orbit with sqere root function (slow to fast))
         - map_plt (maps orbit with matplotlib colormap)
         - map_plt_darker (maps orbit with matplotlib colormap and it's reversed version and returns darker pixel for each pixel)
+        - map_plt_black_white_efficient (maps orbit to black and white pixels through a look-up table)
         - map_reverse (reverses orbit)
         
     - Functions to override:
-        - file_path 
-        - render 
+        - file_path
+        - render
     '''
 
+    # Hand-written closures for well known atractors (no sympy involved),
+    # keyed by the exact atractor string
+    _FAST_ATRACTORS = {
+        "z^2 + const": lambda z, const, a, b, c: z*z + const,
+        "z^2+const": lambda z, const, a, b, c: z*z + const,
+        "z^2 + c": lambda z, const, a, b, c: z*z + c,
+        "z^3 + const": lambda z, const, a, b, c: z*z*z + const,
+    }
+
+    # Compiled sympy lambdas memoized by atractor string (shared between
+    # instances, Julia2gif constructs renderers per animation)
+    _LAMBDA_CACHE = {}
+
     # CONSTRUCTOR
     def __init__(self, atractor:str="z^2 + const", \
                  const:complex=0+0j, \
@@ -150,15 +515,8 @@ class JuliaSetRenderer:
         self.atractor = atractor
         self.const, self.a, self.b, self.c = const, a, b, c
 
-        # evaluate atractor function and symbols
-        # define symbols
-        complex_symbols = symbols('z const a b c')
-
-        # evaluate atractor function to sympy expression
-        atractor_sym_lam = lambdify(complex_symbols, sympify(self.atractor), 'numpy')
-
-        # evaluate atractor function to python function
-        self.atractor_lambda = lambda x1, x2, x3, x4, x5: atractor_sym_lam(x1, x2, x3, x4, x5)
+        # evaluate atractor function
+        self.atractor_lambda = self._get_lambda(atractor)
 
         # initialize rest of atributes
         self.maps = maps
@@ -176,6 +534,34 @@ class JuliaSetRenderer:
 
         self.target_directory = target_directory
 
+        # cache of precomputed colormap look-up tables keyed by (map, max_iter)
+        self.plt_lut_cache = {}
+
+        # last pixel lattice built for the fallback frame renderers,
+        # stored as (key, array) so frames sharing one plane reuse it
+        self.grid_cache = (None, None)
+
+        # device-resident orbit buffer for the CUDA kernel,
+        # allocated on first use and reused across animation frames
+        self.cuda_orbit_buffer = None
+
+    # returns compiled lambda for given atractor expression
+    def _get_lambda(self, atractor:str):
+        '''Returns callable evaluating the atractor function.
+
+        Hand-written closures skip sympy entirely, anything else is
+        compiled once per expression string and memoized, so repeated
+        lookups (constructor, update_parameters) are O(1) dict hits.
+        '''
+        if atractor in self._FAST_ATRACTORS:
+            return self._FAST_ATRACTORS[atractor]
+
+        atractor_lambda = self._LAMBDA_CACHE.get(atractor)
+        if atractor_lambda is None:
+            atractor_lambda = lambdify(symbols('z const a b c'), sympify(atractor), 'numpy')
+            self._LAMBDA_CACHE[atractor] = atractor_lambda
+        return atractor_lambda
+
     # updates given parameters
     def update_parameters(self, atractor:str=None, \
                           const:complex=None, \
@@ -189,12 +575,14 @@ class JuliaSetRenderer:
         # update atributes
         if atractor:
             self.atractor = atractor
-            self.atractor_expr = sympify(self.atractor)
+            self.atractor_lambda = self._get_lambda(atractor)
 
-        if const: self.const = const
-        if a: self.a = a
-        if b: self.b = b
-        if c: self.c = c
+        # explicit None checks - 0+0j is a perfectly valid value for the
+        # complex parameters and a falsy guard would silently skip it
+        if const is not None: self.const = const
+        if a is not None: self.a = a
+        if b is not None: self.b = b
+        if c is not None: self.c = c
 
         if resolution_w: self.res_w = resolution_w
         if resolution_h: self.res_h = resolution_h
@@ -212,6 +600,35 @@ class JuliaSetRenderer:
 
 
     # HELPER FUNCTIONS
+    # Returns the complex pixel lattice for the current range
+    def frame_grid(self, descending:bool=False) -> np.array:
+        '''Returns the complex pixel lattice for the current range.
+
+        Cached on the instance so animations that do not move the plane
+        (render_const_magnitude, render_iter) build it once instead of
+        once per frame; animations that zoom or slide just miss the
+        cache and rebuild.
+
+        The lattice is complex64 (half the bandwidth of complex128
+        through the whole escape loop) until the range span drops below
+        1e-5, where float32 runs out of resolution between neighbouring
+        pixels and the grid widens back to complex128 automatically.
+
+        Parameters:
+        - descending: if True the imaginary axis runs from im_max down to im_min
+        '''
+        key = (self.re_min, self.re_max, self.im_min, self.im_max, \
+               self.res_w, self.res_h, descending)
+        if self.grid_cache[0] != key:
+            im_axis = np.linspace(self.im_max, self.im_min, self.res_h) if descending \
+                else np.linspace(self.im_min, self.im_max, self.res_h)
+            z_arr = np.linspace(self.re_min, self.re_max, self.res_w) + 1j * im_axis[:, np.newaxis]
+            # deep zooms need the full double precision
+            if (self.re_max - self.re_min) >= 1e-5 and (self.im_max - self.im_min) >= 1e-5:
+                z_arr = z_arr.astype(np.complex64)
+            self.grid_cache = (key, z_arr)
+        return self.grid_cache[1]
+
     # Maps screen coordinates into complex plane
     def pixel2complex(self, x:int, y:int) -> complex:
         '''Maps screen coordinates (pixels) into complex plane (complex numbers)'''
@@ -237,6 +654,77 @@ class JuliaSetRenderer:
             
         return self.max_iter-1
 
+    # Tries to render orbits with a kernel generated for the atractor expression
+    def _render_orbits_fast(self, data:np.array) -> bool:
+        '''
+        Fills data with a kernel generated for the atractor expression and
+        returns True, or returns False when the expression could not be
+        compiled (caller falls back to the complex-array path).
+
+        With a CUDA capable GPU the kernel runs one thread per pixel with
+        the orbit buffer staying device-resident between calls, so an
+        animation only moves the finished uint16 counts back per frame.
+        The kernels derive pixel coordinates themselves, so the full
+        H x W complex grid is never materialized.
+        '''
+        # a, b, c default to None in the parent constructor
+        const = complex(self.const) if self.const else 0j
+        a = complex(self.a) if self.a else 0j
+        b = complex(self.b) if self.b else 0j
+        c = complex(self.c) if self.c else 0j
+
+        kernel_cuda = _compile_atractor_kernel_cuda(self.atractor)
+        if kernel_cuda is not None:
+            dx = (self.re_max - self.re_min) / self.res_w
+            dy = (self.im_max - self.im_min) / self.res_h
+            # device buffer reused across animation frames
+            if self.cuda_orbit_buffer is None or self.cuda_orbit_buffer.shape != data.shape:
+                self.cuda_orbit_buffer = cuda.device_array_like(data)
+            threads_per_block = (16, 16)
+            blocks_per_grid = ((self.res_w + 15) // 16, (self.res_h + 15) // 16)
+            kernel_cuda[blocks_per_grid, threads_per_block]( \
+                self.re_min, dx, self.im_min, dy, \
+                const.real, const.imag, a.real, a.imag, \
+                b.real, b.imag, c.real, c.imag, \
+                self.max_iter, self.max_mag * self.max_mag, self.cuda_orbit_buffer)
+            self.cuda_orbit_buffer.copy_to_host(data)
+            return True
+
+        kernel = _compile_atractor_kernel(self.atractor)
+        if kernel is None:
+            return False
+
+        kernel(self.re_min, self.re_max, self.im_min, self.im_max, \
+               const.real, const.imag, a.real, a.imag, \
+               b.real, b.imag, c.real, c.imag, \
+               self.max_iter, self.max_mag, data)
+
+        return True
+
+    # Checks whether orbit counts are point-symmetric about the origin
+    def _plane_symmetric(self) -> bool:
+        '''True when the atractor is the even z^2 family (f(-z) = f(z),
+        so -z0 and z0 share their whole orbit) and the plane is centered
+        on the origin — the rendered image is then point-symmetric.'''
+        return self.atractor.replace(' ', '') in ("z^2+const", "z^2+c") and \
+            math.isclose(self.re_min, -self.re_max) and \
+            math.isclose(self.im_min, -self.im_max)
+
+    # Fills data with orbits using the vectorized fallback loop
+    def _render_orbits_fallback(self, data:np.array, descending:bool=False) -> None:
+        '''Vectorized fallback orbit pass.
+
+        On centered planes with an even atractor only the top half gets
+        computed and the bottom half is its point reflection — the
+        linspace lattice mirrors exactly, halving the escape-time work.
+        '''
+        if self._plane_symmetric():
+            half = (self.res_h + 1) // 2
+            self.if_in_julia_set_vectorized(self.frame_grid(descending)[:half], data[:half])
+            data[half:] = data[:self.res_h - half][::-1, ::-1]
+            return
+        self.if_in_julia_set_vectorized(self.frame_grid(descending), data)
+
     # Calculates if Julia set contains a given point (vectorized version)
     def if_in_julia_set_vectorized(self, z_arr:np.array, data:np.array) -> None:
         '''
@@ -252,23 +740,42 @@ class JuliaSetRenderer:
         - data: array to populate with iterations till exceeding max_magnitude or max_ieration if not exceeded (np.array)
         '''
 
-        # initialize helper arrays
-        not_exceeding = np.ones_like(data, dtype=bool) 
+        # initialize helper arrays, flat so the active set can be compacted
+        mag2 = self.max_mag * self.max_mag
+        data_flat = data.reshape(-1)
+        # copied, so passed (possibly cached) lattices are left untouched
+        z_flat = z_arr.reshape(-1).copy()
+        active_idx = np.arange(z_flat.size) # flat pixel indices z_flat refers to
+        not_exceeding = np.ones(z_flat.size, dtype=bool)
 
         # iterate till exceeding max_magnitude or max_ieration if not exceeded
-        for _ in np.arange(self.max_iter):
+        for n in np.arange(self.max_iter):
 
-            # evaluate atractor function for relevant pixels, for current iteration
-            z_arr = np.where(not_exceeding, self.atractor_lambda(z_arr, self.const, self.a, self.b, self.c), z_arr)
+            # evaluate atractor function only for the not-yet-exceeding pixels
+            # (masked assignment instead of np.where spares two full-image
+            # complex temporaries per iteration)
+            z_alive = self.atractor_lambda(z_flat[not_exceeding], self.const, self.a, self.b, self.c)
+            z_flat[not_exceeding] = z_alive
 
-            # mark points exceeding max_magnitude
-            not_exceeding = ~(np.abs(z_arr) > self.max_mag)
+            # mark points exceeding max_magnitude, compared in squared
+            # magnitude so np.abs does not take a sqrt per pixel
+            not_exceeding[not_exceeding] = \
+                z_alive.real * z_alive.real + z_alive.imag * z_alive.imag <= mag2
 
             # update data
-            data[not_exceeding] += 1
+            data_flat[active_idx[not_exceeding]] += 1
+
+            # once everything escaped there is nothing left to iterate
+            remaining = np.count_nonzero(not_exceeding)
+            if remaining == 0:
+                break
 
-        # shift largest elements to not exceed uint8 range
-        data[data == self.max_iter] = self.max_iter-1
+            # every 16 iterations shrink the working arrays to the still-active
+            # pixels (same compaction scheme as the NumPy fallback kernel)
+            if (n & 15) == 15 and remaining < not_exceeding.size // 2:
+                active_idx = active_idx[not_exceeding]
+                z_flat = z_flat[not_exceeding]
+                not_exceeding = np.ones(remaining, dtype=bool)
 
     # Distributes points in a way that there are less dense points in the middle and more dense on the edges
     # TODO:
@@ -377,7 +884,8 @@ class JuliaSetRenderer:
     # MAPPING FUNCTIONS
     def map_slow2fast(self, orbits:np.array) -> np.array:
         '''Maps orbits array with sqere root function (slow to fast)'''
-        return np.vectorize(lambda x: int(math.sqrt(x / self.max_iter) * self.max_iter))(orbits)
+        # one vectorized pass (np.vectorize is a python loop per pixel)
+        return (np.sqrt(orbits / self.max_iter) * self.max_iter).astype(orbits.dtype)
 
     # TODO: describe
     def map_mod(self, orbits:np.array, modulo:int=10) -> np.array:
@@ -389,6 +897,20 @@ class JuliaSetRenderer:
     def map_plt(self, orbits:np.array, map:str="twilight_shifted") -> np.array:
         '''Maps orbits with matplotlib colormap'''
 
+        # orbits are integer iteration counts, so the colormap only ever gets
+        # evaluated at max_iter+1 points, precompute those once into a look-up
+        # table and colorize the whole image with a single fancy index
+        if np.issubdtype(orbits.dtype, np.integer):
+            lut = self.plt_lut_cache.get((map, self.max_iter))
+            if lut is None:
+                cmap = plt.colormaps[map]
+                lut = (cmap(np.arange(self.max_iter + 1) / self.max_iter)[:,:3] \
+                       * 255).astype(np.uint8) # remove alpha channel
+                self.plt_lut_cache[(map, self.max_iter)] = lut
+            # chained maps like "add" can push counts past max_iter, the old
+            # float path clamped those implicitly so the table does too
+            return lut[np.minimum(orbits, self.max_iter)]
+
         # normalize orbits
         normalized_orbits = orbits / self.max_iter
 
@@ -396,25 +918,57 @@ class JuliaSetRenderer:
         cmap = plt.colormaps[map]
 
         # map orbits
-        return (cmap(normalized_orbits)[:,:,:3] * self.max_iter).astype(np.uint8) # remove alpha channel
+        return (cmap(normalized_orbits)[:,:,:3] * 255).astype(np.uint8) # remove alpha channel
     
     def map_plt_darker(self, orbits:np.array, map:str="twilight_shifted") -> np.array:
         '''Maps orbits with matplotlib colormap and it's reversed version and returns darker pixel for each pixel'''
 
+        # the darker of two colormaps is itself just a colormap, so for
+        # integer orbits precompute it as one look-up table (same scheme
+        # as map_plt) and colorize with a single fancy index
+        if np.issubdtype(orbits.dtype, np.integer):
+            lut = self.plt_lut_cache.get((map + " darker", self.max_iter))
+            if lut is None:
+                levels = np.arange(self.max_iter + 1) / self.max_iter
+                lut = np.minimum(plt.colormaps[map](levels)[:,:3], \
+                                 plt.colormaps[map + "_r"](levels)[:,:3])
+                lut = (lut * 255).astype(np.uint8) # remove alpha channel
+                self.plt_lut_cache[(map + " darker", self.max_iter)] = lut
+            # same clamp as map_plt - chained maps can exceed max_iter
+            return lut[np.minimum(orbits, self.max_iter)]
+
         # normalize orbits
         normalized_orbits = orbits / self.max_iter
 
         # get colormap
-        cmap = plt.colormaps[map[:-2]] if map[:-2] == "_r" else plt.colormaps[map]
         cmap = plt.colormaps[map]
         cmapr = plt.colormaps[map + "_r"]
 
-        # map orbits
-        (cmapr(normalized_orbits)[:,:,:3] * self.max_iter).astype(np.uint8) # remove alpha channel
-        (cmap(normalized_orbits)[:,:,:3] * self.max_iter).astype(np.uint8) # remove alpha channel
+        # map orbits, evaluating each colormap once and taking the darker
+        # pixel in place (no (2, H, W, 3) stack temporary)
+        mapped = (cmap(normalized_orbits)[:,:,:3] * 255).astype(np.uint8) # remove alpha channel
+        mapped_r = (cmapr(normalized_orbits)[:,:,:3] * 255).astype(np.uint8) # remove alpha channel
+        np.minimum(mapped, mapped_r, out=mapped)
+
+        return mapped
 
-        return np.array([cmapr(normalized_orbits)[:,:,:3] * self.max_iter, \
-                         cmap(normalized_orbits)[:,:,:3] * self.max_iter]).min(axis=0).astype(np.uint8) # remove alpha channel
+    def map_plt_black_white_efficient(self, orbits:np.array, threshold:str='') -> np.array:
+        '''
+        Maps orbits to black and white pixels through a precomputed look-up
+        table, pixels with orbit >= threshold become white and the rest black
+        (a plain grayscale ramp when no threshold is given).
+        '''
+        lut = self.plt_lut_cache.get(("b&w " + threshold, self.max_iter))
+        if lut is None:
+            levels = np.arange(self.max_iter + 1)
+            if threshold:
+                ramp = np.where(levels >= int(threshold), 255, 0).astype(np.uint8)
+            else:
+                ramp = (levels * 255 // self.max_iter).astype(np.uint8)
+            lut = np.stack((ramp, ramp, ramp), axis=1)
+            self.plt_lut_cache[("b&w " + threshold, self.max_iter)] = lut
+        # same clamp as map_plt - chained maps can exceed max_iter
+        return lut[np.minimum(orbits, self.max_iter)]
 
     def map_reverse(self, orbits:np.array) -> np.array:
         '''Reverses orbits'''
@@ -422,7 +976,8 @@ class JuliaSetRenderer:
 
     def map_cut_off(self, orbits:np.array, cut_off:int=0) -> np.array:
         '''Cuts off orbits below cut_off'''
-        return np.vectorize(lambda x: x if x >= cut_off else 0)(orbits)
+        # one vectorized pass (np.vectorize is a python loop per pixel)
+        return np.where(orbits >= cut_off, orbits, 0)
 
 
     # FUNCTIONS TO OVERRIDE
@@ -440,6 +995,11 @@ class Julia2png(JuliaSetRenderer):
     - file_path (returns file name for given parameters)
 
     - prepare_metadata (prepares metadata for .png file)
+    - render_kernel (renders Julia set as numpy array using the compiled numba kernel)
+    - render_cuda (renders Julia set as numpy array on the GPU when available)
+    - render_rowwise (renders Julia set as numpy array using the row-at-a-time gufunc)
+    - render_numpy (renders Julia set as numpy array using the NumPy fallback kernel)
+    - render_tilewise (renders Julia set as numpy array in cache-resident tiles)
     - render_vectorwise (renders Julia set as numpy array using vectorized render mode)
     - render_pixelwise (renders Julia set as numpy array using pixelwise render mode)
     - print_histogram (prints "histogram" of orbits)
@@ -455,8 +1015,14 @@ class Julia2png(JuliaSetRenderer):
                  resolution_w:int=1000, resolution_h:int=1000, \
                  range:tuple=(-2,2,-2,2), \
                  max_ieration:int=256, max_magnitude:float=2, \
-                 target_directory:str="renders_png") -> None:
-        '''Constructor''' 
+                 target_directory:str="renders_png", \
+                 dtype:type=np.float64) -> None:
+        '''
+        Constructor
+
+        dtype sets the working precision of the NumPy fallback kernel
+        (np.float32 halves the memory bandwidth at reduced deep-zoom precision).
+        '''
 
         # initialize parent constructor with changed default target_directory
         super().__init__(atractor, const, a, b, c, maps, \
@@ -464,19 +1030,22 @@ class Julia2png(JuliaSetRenderer):
                          range, max_ieration, max_magnitude, \
                          target_directory)
 
-        
+        # working precision of the NumPy fallback kernel
+        self.dtype = dtype
+
+        # orbit buffer reused between renders (allocated on first render)
+        self.orbit_buffer = None
+
+
     # returns file name for given directory
     def file_path(self) -> os.path:
         '''
         Returns file name for given directory:
         julia_atractor_const_a_b_c_resolution_range_max_iterations_max_magnitude_mappings.png
         '''
-        # characters forbidden in file names
-        forbidden_chars = re.compile(r'[~\\/:"*?<>|] ')
-
         # return file name with given parameters and forbidden characters replaced with '_'
-        #return os.path.join(self.target_directory, re.sub(forbidden_chars,'_', \
-        return os.path.join(re.sub(forbidden_chars,'_', \
+        #return os.path.join(self.target_directory, _forbidden_chars.sub('_', \
+        return os.path.join(_forbidden_chars.sub('_', \
                             "julia_" + self.atractor + \
                             "_c=" + str(self.const) + \
                             (("_a=" + str(self.a)) if self.a else "") + \
@@ -487,7 +1056,7 @@ class Julia2png(JuliaSetRenderer):
                                 '_' + str(self.im_min) + '_' + str(self.im_max) + \
                             "_iter_" + str(self.max_iter) + \
                             "_mag_" + str(self.max_mag) + \
-                            "_map_" + reduce(lambda x, y: x + "_" + y, self.maps) + \
+                            "_map_" + "_".join(self.maps) + \
                             ".png"))
 
     # prepares metadata for .png file
@@ -502,7 +1071,7 @@ class Julia2png(JuliaSetRenderer):
         metadata.add_text('RANGE', str(self.im_min) + ' ' + str(self.im_max) + ' ' + str(self.re_min) + ' ' + str(self.re_max))
         metadata.add_text('MAX_ITERATIONS', str(self.max_iter))
         metadata.add_text('MAX_MAGNITUDE', str(self.max_mag))
-        metadata.add_text('MAPPING', reduce(lambda x, y: x + "_" + y, self.maps))
+        metadata.add_text('MAPPING', "_".join(self.maps))
 
         return metadata
 
@@ -515,6 +1084,14 @@ class Julia2png(JuliaSetRenderer):
         print("calculating orbits (vectorwise)...", end="", flush=True)
         start = time.time()
 
+        # a kernel generated for this exact atractor expression (GPU when
+        # available) beats the sympy lambda + complex-array loop by orders
+        # of magnitude
+        if self._render_orbits_fast(data):
+            print("\rcalculating orbits (vectorwise) DONE " + \
+                    f"(time: {time.time() - start:.2f}s)")
+            return
+
         # initialize array of complex numbers corresponding to pixels
         # np.linspace creates array of evenly spaced numbers over resoluton range
         # np.newaxis adds new axis (column vector) to array
@@ -529,10 +1106,147 @@ class Julia2png(JuliaSetRenderer):
         print("\rcalculating orbits (vectorwise) DONE " + \
                 f"(time: {time.time() - start:.2f}s)")
         
+    # renders Julia set as numpy array using the compiled numba kernel
+    def render_kernel(self, data:np.array) -> None:
+        '''Renders Julia set as numpy array using the compiled escape-time kernel (z^2 + const only)'''
+
+        print("calculating orbits (numba)...     ", end="", flush=True)
+        start = time.time()
+
+        # without numba use the ahead-of-time build (single-threaded but no JIT warmup)
+        if not NUMBA_AVAILABLE:
+            data[:] = _julia_ext.julia_kernel(self.re_min, self.re_max, self.im_min, self.im_max, \
+                                              complex(self.const).real, complex(self.const).imag, \
+                                              self.max_iter, self.max_mag, \
+                                              self.res_h, self.res_w)
+        else:
+            # calculate orbits with the compiled kernel (operates in-place on data)
+            _julia_kernel(self.re_min, self.re_max, self.im_min, self.im_max, \
+                          complex(self.const).real, complex(self.const).imag, \
+                          self.max_iter, self.max_mag, data)
+
+        print("\rcalculating orbits (numba)      DONE " + \
+                f"(time: {time.time() - start:.2f}s)")
+
+    # renders Julia set as numpy array using the row-at-a-time gufunc
+    def render_rowwise(self, data:np.array) -> None:
+        '''Renders Julia set as numpy array using the guvectorize row kernel (z^2 + const only)'''
+
+        print("calculating orbits (rowwise)...   ", end="", flush=True)
+        start = time.time()
+
+        # one gufunc call fills the whole image, rows are threaded by numba
+        re_row = np.linspace(self.re_min, self.re_max, self.res_w)
+        im_col = np.linspace(self.im_min, self.im_max, self.res_h)
+        _julia_row(re_row[np.newaxis, :], im_col, \
+                   complex(self.const).real, complex(self.const).imag, \
+                   self.max_iter, self.max_mag, data)
+
+        print("\rcalculating orbits (rowwise)    DONE " + \
+                f"(time: {time.time() - start:.2f}s)")
+
+    # renders Julia set as numpy array on the GPU
+    def render_cuda(self, data:np.array) -> None:
+        '''Renders Julia set as numpy array using the CUDA kernel (z^2 + const only)'''
+
+        print("calculating orbits (cuda)...      ", end="", flush=True)
+        start = time.time()
+
+        # one thread per pixel over a 16x16 block grid
+        dx = (self.re_max - self.re_min) / self.res_w
+        dy = (self.im_max - self.im_min) / self.res_h
+        threads_per_block = (16, 16)
+        blocks_per_grid = ((self.res_w + 15) // 16, (self.res_h + 15) // 16)
+
+        data_device = cuda.device_array_like(data)
+        _julia_kernel_cuda[blocks_per_grid, threads_per_block]( \
+            self.re_min, dx, self.im_min, dy, \
+            complex(self.const).real, complex(self.const).imag, \
+            self.max_iter, self.max_mag * self.max_mag, data_device)
+        data_device.copy_to_host(data)
+
+        print("\rcalculating orbits (cuda)       DONE " + \
+                f"(time: {time.time() - start:.2f}s)")
+
+    # renders Julia set as numpy array tile by tile
+    def render_tilewise(self, data:np.array, tile:int=256) -> None:
+        '''
+        Renders Julia set as numpy array in tile x tile blocks (z^2 + const only).
+        Keeps the kernel working set small enough to stay cache-resident,
+        which pays off at the large resolutions from the header TODO.
+        '''
+
+        print("calculating orbits (tilewise)...  ", end="", flush=True)
+        start = time.time()
+
+        # tile sub-ranges are chosen so the tile lattice matches the full-image lattice
+        c_re, c_im = complex(self.const).real, complex(self.const).imag
+        dx = (self.re_max - self.re_min) / self.res_w
+        dy = (self.im_max - self.im_min) / self.res_h
+
+        def render_tile(ty, tx):
+            sub = data[ty:ty + tile, tx:tx + tile]
+            args = (self.re_min + tx * dx, self.re_min + (tx + sub.shape[1]) * dx, \
+                    self.im_min + ty * dy, self.im_min + (ty + sub.shape[0]) * dy, \
+                    c_re, c_im, self.max_iter, self.max_mag, sub)
+            if NUMBA_AVAILABLE:
+                _julia_kernel(*args)
+            else:
+                # the fallback also takes the working precision of the z arrays
+                _julia_numpy(*args, self.dtype)
+
+        corners = [(ty, tx) for ty in range(0, self.res_h, tile) \
+                            for tx in range(0, self.res_w, tile)]
+
+        if NUMBA_AVAILABLE:
+            # the numba kernel threads its rows internally (parallel=True),
+            # stacking a tile pool on top would only oversubscribe the cores
+            for ty, tx in corners:
+                render_tile(ty, tx)
+        else:
+            # the numpy kernel is single threaded but releases the GIL inside
+            # its C loops, so independent tiles scale across cores
+            # (tiles never overlap, each thread writes its own slice of data)
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                list(pool.map(lambda c: render_tile(*c), corners))
+
+        print("\rcalculating orbits (tilewise)   DONE " + \
+                f"(time: {time.time() - start:.2f}s)")
+
+    # renders Julia set as numpy array using the pure NumPy kernel
+    def render_numpy(self, data:np.array) -> None:
+        '''Renders Julia set as numpy array using the NumPy fallback kernel (z^2 + const only)'''
+
+        # above ~1M pixels the z arrays overflow L2 and every escape-loop
+        # iteration streams them from DRAM — render in 128 x 128 blocks
+        # instead so each tile stays cache-resident for all max_iter passes
+        # (the numba kernel has good per-row locality and needs no tiling)
+        if self.res_w * self.res_h > 1 << 20:
+            self.render_tilewise(data, 128)
+            return
+
+        print("calculating orbits (numpy)...     ", end="", flush=True)
+        start = time.time()
+
+        # calculate orbits with the fallback kernel (operates in-place on data)
+        _julia_numpy(self.re_min, self.re_max, self.im_min, self.im_max, \
+                     complex(self.const).real, complex(self.const).imag, \
+                     self.max_iter, self.max_mag, data, self.dtype)
+
+        print("\rcalculating orbits (numpy)      DONE " + \
+                f"(time: {time.time() - start:.2f}s)")
+
     # renders Julia set into as numpy array using pixelwise render mode
     def render_pixelwise(self, data:np.array) -> np.array:
         '''Renders Julia set as numpy array using pixelwise render mode'''
 
+        # direct callers also get the compiled kernel for the default atractor,
+        # the python loop below is interpreter-dispatch bound (orders of
+        # magnitude slower than the unboxed machine code)
+        if self.atractor.replace(' ', '') == "z^2+const" and (NUMBA_AVAILABLE or AOT_AVAILABLE):
+            self.render_kernel(data)
+            return
+
         # initialize loading bar
         lb = LoadingBar(self.res_h)
 
@@ -570,31 +1284,51 @@ class Julia2png(JuliaSetRenderer):
         print()
 
     # renders Julia set into .png file
-    def render(self, vectorize_render:bool=False, display_orbits_histogram=False) -> None:
+    def render(self, vectorize_render:bool=False, display_orbits_histogram=False, tile:int=0) -> None:
         '''
         Renders Julia set into .png file
-        
+
         Parameters:
         - vectorize_render: if True uses vectorized render,
                             but does not display loading bar
                             (bool) (default: False)
-          
+
         - display_orbits_histogram: if True displays orbits histogram in console
                                     (bool) (default: False)
+
+        - tile: if set, renders in tile x tile cache-resident blocks
+                (z^2 + const only, recommended for very large resolutions)
+                (int) (default: 0 - whole image at once)
         '''
 
         print("initializing...", end="")
-        # initialize image
-        image = Image.new('RGB', (self.res_h, self.res_w))
         # create metadata:
         metadata = self.prepare_metadata()
-        # initialize data
-        data = np.zeros((self.res_h, self.res_w), dtype=np.uint8)
+        # initialize data, reusing the buffer between renders (repeated calls
+        # e.g. while tweaking parameters skip the multi-MB allocation + zeroing)
+        if self.orbit_buffer is None or self.orbit_buffer.shape != (self.res_h, self.res_w):
+            self.orbit_buffer = np.zeros((self.res_h, self.res_w), dtype=np.uint16)
+        else:
+            self.orbit_buffer.fill(0)
+        data = self.orbit_buffer
         print("\rinitializing                     DONE")
 
         # create data:
+        # dedicated kernels for the default atractor (much faster than both python paths)
+        if self.atractor.replace(' ', '') == "z^2+const":
+            # tiled mode keeps the working set cache-resident for huge images
+            if tile: self.render_tilewise(data, tile)
+            # a CUDA capable GPU beats every CPU path at these resolutions
+            elif CUDA_AVAILABLE: self.render_cuda(data)
+            # without numba fall back to the AOT build, then the pure NumPy kernel
+            elif not NUMBA_AVAILABLE and not AOT_AVAILABLE: self.render_numpy(data)
+            # vectorize_render selects the row-at-a-time gufunc backend
+            # (the gufunc only exists under numba - with just the AOT build
+            # present the flag falls through to render_kernel's AOT path)
+            elif vectorize_render and NUMBA_AVAILABLE: self.render_rowwise(data)
+            else: self.render_kernel(data)
         # vectorwise render mode
-        if vectorize_render: self.render_vectorwise(data)
+        elif vectorize_render: self.render_vectorwise(data)
         # pixelwise render mode
         else: self.render_pixelwise(data)
 
@@ -655,11 +1389,8 @@ class Julia2gif(JuliaSetRenderer):
         Returns file name for given directory:
         julia_atractor_const_a_b_c_resolution_range_max_iterations_max_magnitude_mappings.gif
         '''
-        # characters forbidden in file names
-        forbidden_chars = re.compile(r'[~\\/:"*?<>|] ')
-
         # return file name with given parameters and forbidden characters replaced with '_'
-        return os.path.join(self.target_directory, re.sub(forbidden_chars,'_', \
+        return os.path.join(self.target_directory, _forbidden_chars.sub('_', \
                             "julia_" + self.atractor + \
                             "_c=" + str(self.const) + \
                             (("_a=" + str(self.a)) if self.a else "") + \
@@ -670,7 +1401,7 @@ class Julia2gif(JuliaSetRenderer):
                             #    '_' + str(self.im_min) + '_' + str(self.im_max) + \
                             #"_iter_" + str(self.max_iter) + \
                             #"_mag_" + str(self.max_mag) + \
-                            "_map_" + reduce(lambda x, y: x + "_" + y, self.maps) + \
+                            "_map_" + "_".join(self.maps) + \
                             ".gif"))
 
     # TODO:
@@ -678,12 +1409,11 @@ class Julia2gif(JuliaSetRenderer):
     # renders Julia set as Image
     def render_frame(self, data:np.array) -> Image:
         '''Renders Julia set as numpy array'''
-        z_arr = np.linspace(self.re_min, self.re_max, self.res_w) + 1j \
-            * np.linspace(self.im_min, self.im_max, self.res_h)[:, np.newaxis]
-        
-        # calculate orbits
-        self.if_in_julia_set_vectorized(z_arr, data)
-        #self.if_in_mandelbrot_set(z_arr, data)
+        # calculate orbits, a generated kernel skips materializing
+        # the full complex grid every frame
+        if not self._render_orbits_fast(data):
+            self._render_orbits_fallback(data)
+            #self.if_in_mandelbrot_set(self.frame_grid(), data)
 
         # map data to colors
         data = self.render_color_mapping(data)
@@ -691,18 +1421,31 @@ class Julia2gif(JuliaSetRenderer):
         # return image
         return Image.fromarray(data, 'RGB')
 
+    # streams frames into .gif file as they are produced
+    def save_gif_streaming(self, frame_iterator, file_path:str, frame_duration:int) -> None:
+        '''Streams frames from the passed iterator into .gif file.
+
+        PIL consumes append_images lazily, so handing it the live
+        iterator encodes each frame as it is produced and holds only
+        one frame in RAM, instead of first collecting the whole
+        animation in a list.
+        '''
+        first_frame = next(frame_iterator)
+        first_frame.save(file_path, format='GIF', append_images=frame_iterator, \
+                         save_all=True, duration=frame_duration, loop=0)
+
     # renders Julia set as Image with color shift
     # overloaded for sideways_slide_with_color_shift_and_const_shift function
     def render_frame_slide(self, data:np.array, color_shift:int=0) -> Image:
         '''Renders Julia set as numpy array with color shift'''
-        z_arr = np.linspace(self.re_min, self.re_max, self.res_w) + 1j \
-            * np.linspace(self.im_min, self.im_max, self.res_h)[:, np.newaxis]
-        
-        # calculate orbits
-        self.if_in_julia_set_vectorized(z_arr, data)
+        # calculate orbits, a generated kernel skips materializing
+        # the full complex grid every frame
+        if not self._render_orbits_fast(data):
+            self._render_orbits_fallback(data)
 
-        # shift colors
-        data = (data + color_shift) % self.max_iter
+        # shift colors, kept integer so the colormap stays on the
+        # precomputed look-up-table path instead of re-interpolating floats
+        data = ((data + int(color_shift)) % self.max_iter).astype(np.uint16)
 
         # map data to colors
         data = self.render_color_mapping(data)
@@ -716,23 +1459,87 @@ class Julia2gif(JuliaSetRenderer):
     
         data = np.zeros((self.res_h, self.res_w), dtype=np.uint16)
 
-        z_arr = np.linspace(self.re_min, self.re_max, self.res_w) + 1j \
-            * np.linspace(self.im_max, self.im_min, self.res_h)[:, np.newaxis]
-        
-        
-        # calculate orbits
-        self.if_in_julia_set_vectorized(z_arr, data)
+        # calculate orbits (this frame runs top-down, so the kernel
+        # output gets flipped vertically to keep the old orientation)
+        if self._render_orbits_fast(data):
+            data = data[::-1]
+        else:
+            self._render_orbits_fallback(data, descending=True)
 
         # map data to colors
-        # normalize orbits 
-        normalized_orbits = data / self.max_iter
-        # get colormap
-        cmap = plt.colormaps[color_map]
-        # map orbits
-        pixels = (cmap(normalized_orbits)[:,:,:3] * 255).astype(np.uint8) # remove alpha channel
+        # quantize the uint16 counts to 256 levels with the usual
+        # log-smoothed mapping (counts go up to 2048 in render_iter but a
+        # GIF is 8-bit anyway, and one byte per pixel is all the colormap
+        # step needs to touch afterwards)
+        scale = 255.0 / np.log2(np.log2(self.max_iter) + 1)
+        smooth = (np.log2(np.log2(np.maximum(data, 1)) + 1) * scale).astype(np.uint8)
+        # get 256-entry colormap look-up table (cached per colormap)
+        lut = self.plt_lut_cache.get((color_map + " u8", 256))
+        if lut is None:
+            cmap = plt.colormaps[color_map]
+            lut = (cmap(np.arange(256) / 255)[:, :3] * 255).astype(np.uint8) # remove alpha channel
+            self.plt_lut_cache[(color_map + " u8", 256)] = lut
+        # return palette image straight from the quantized counts:
+        # 8-bit "P" matches PIL's internal storage, so frombuffer wraps the
+        # byte buffer without the RGB unpack copy, the LUT becomes the
+        # palette and GIF encoding skips re-quantizing the colors
+        image = Image.frombuffer('P', (self.res_w, self.res_h), \
+                                 np.ascontiguousarray(smooth), 'raw', 'P', 0, 1)
+        image.putpalette(lut.reshape(-1))
+        return image
+
+    def if_in_julia_set_batched(self, z_batch:np.array, const_batch, data:np.array) -> None:
+        '''
+        Calculates orbits for a whole batch of frames at once.
 
-        # return image
-        return Image.fromarray(pixels, 'RGB')
+        Batched version of if_in_julia_set_vectorized: z_batch has shape
+        (B, res_h, res_w) and const_batch broadcasts against it
+        ((B, 1, 1) for a const per frame or a plain scalar).
+        Running the escape loop on the stacked batch amortizes the
+        per-iteration NumPy dispatch overhead over B frames.
+        Operates on passed data array !!!
+
+        Parameters:
+        - z_batch: (B, res_h, res_w) array of complex numbers corresponding to pixels (np.array)
+        - const_batch: const value per frame, broadcastable to z_batch (np.array or complex)
+        - data: (B, res_h, res_w) array to populate with iterations till exceeding max_magnitude or max_ieration if not exceeded (np.array)
+        '''
+
+        # initialize helper arrays, flat so the active set can be compacted
+        mag2 = self.max_mag * self.max_mag
+        data_flat = data.reshape(-1)
+        z_flat = z_batch.reshape(-1).copy()
+        const_flat = np.broadcast_to(const_batch, z_batch.shape).reshape(-1)
+        active_idx = np.arange(z_flat.size) # flat pixel indices z_flat refers to
+        not_exceeding = np.ones(z_flat.size, dtype=bool)
+
+        # iterate till exceeding max_magnitude or max_ieration if not exceeded
+        for n in np.arange(self.max_iter):
+
+            # evaluate atractor function only for the not-yet-exceeding pixels
+            z_alive = self.atractor_lambda(z_flat[not_exceeding], const_flat[not_exceeding], \
+                                           self.a, self.b, self.c)
+            z_flat[not_exceeding] = z_alive
+
+            # mark points exceeding max_magnitude (squared magnitude, no sqrt)
+            not_exceeding[not_exceeding] = \
+                z_alive.real * z_alive.real + z_alive.imag * z_alive.imag <= mag2
+
+            # update data
+            data_flat[active_idx[not_exceeding]] += 1
+
+            # once everything escaped there is nothing left to iterate
+            remaining = np.count_nonzero(not_exceeding)
+            if remaining == 0:
+                break
+
+            # every 16 iterations shrink the working arrays to the still-active
+            # pixels (same compaction scheme as if_in_julia_set_vectorized)
+            if (n & 15) == 15 and remaining < not_exceeding.size // 2:
+                active_idx = active_idx[not_exceeding]
+                z_flat = z_flat[not_exceeding]
+                const_flat = const_flat[not_exceeding]
+                not_exceeding = np.ones(remaining, dtype=bool)
 
     # TODO
     # - refactoring
@@ -742,53 +1549,84 @@ class Julia2gif(JuliaSetRenderer):
 
         # initialize loading bar
         lb = LoadingBar(frames_amount)
+        # batch progress redraws: each update rewrites the whole bar to
+        # stdout, which would dominate millisecond-fast frames
+        tick = max(1, frames_amount // 100)
+
+        # frames get rendered in batches of _BATCH_SIZE so the escape loop
+        # runs on (B, res_h, res_w) tensors instead of one image at a time
+        _BATCH_SIZE = 8
 
         if mode == "1":
-            # loop through frames
+            # the pixel grid is fixed, only const changes per frame
+            z_arr = np.linspace(self.re_min, self.re_max, self.res_w) + 1j \
+                * np.linspace(self.im_min, self.im_max, self.res_h)[:, np.newaxis]
+            const_values = np.linspace(range_[0], range_[1], frames_amount)
+
+            # loop through batches of frames
             frames = []
-            for i, re in enumerate(np.linspace(range[0], range[1], frames_amount)):
+            for start in np.arange(0, frames_amount, _BATCH_SIZE):
+                batch_c = const_values[start:start + _BATCH_SIZE]
 
-                # update c_constant
-                c = complex(re, 0)
+                # render whole batch at once on the shared grid
+                z_batch = np.broadcast_to(z_arr, (batch_c.size, self.res_h, self.res_w))
+                data = np.zeros(z_batch.shape, dtype=np.uint16)
+                self.if_in_julia_set_batched(z_batch, \
+                                             batch_c.astype(complex).reshape(-1, 1, 1), data)
 
-                # render frame
-                frames += [self.render_frame(c_constant=c)]
+                # map batch to frames
+                for k in np.arange(batch_c.size):
+                    frames += [Image.fromarray(self.render_color_mapping(data[k]), 'RGB')]
 
-                # update loading bar
-                lb.update(iteration=i+1)
+                    # update loading bar
+                    lb.update(iteration=start+k+1, skip_every_other=tick)
 
         elif mode == "2":
 
             c = 0.3336913831353 + 0.39768037241511j
-            # loop through frames
+            # loop through batches of frames
             frames = []
-            for i in range(frames_amount):
+            for start in np.arange(0, frames_amount, _BATCH_SIZE):
+                batch_size = min(_BATCH_SIZE, frames_amount - start)
 
-                # update range
-                self.re_min += 0.0002
-                self.re_max -= 0.0002
-                self.im_min += 0.0002
-                self.im_max -= 0.0002
+                # stack the per-frame (shrinking) grids into one batch,
+                # const stays the same for every frame
+                z_batch = np.empty((batch_size, self.res_h, self.res_w), dtype=complex)
+                for k in np.arange(batch_size):
 
-                # render frame
-                frames += [self.render_frame(c_constant=c, map="BuGn")]
+                    # update range
+                    self.re_min += 0.0002
+                    self.re_max -= 0.0002
+                    self.im_min += 0.0002
+                    self.im_max -= 0.0002
 
-                # update loading bar
-                lb.update(iteration=i+1)
+                    z_batch[k] = np.linspace(self.re_min, self.re_max, self.res_w) + 1j \
+                        * np.linspace(self.im_min, self.im_max, self.res_h)[:, np.newaxis]
+
+                # render whole batch at once
+                data = np.zeros(z_batch.shape, dtype=np.uint16)
+                self.if_in_julia_set_batched(z_batch, c, data)
+
+                # map batch to frames
+                for k in np.arange(batch_size):
+                    frames += [Image.fromarray(self.map_plt(data[k], 'BuGn'), 'RGB')]
+
+                    # update loading bar
+                    lb.update(iteration=start+k+1, skip_every_other=tick)
 
         elif mode == "3":
             c_constant = -0.8 + 0.156j
 
             # render image
-            data = np.zeros((self.res_h, self.res_w), dtype=np.uint8)
-
-            # loop through pixels
-            for im in range(self.res_h):
-                for re in range(self.res_w):
+            data = np.zeros((self.res_h, self.res_w), dtype=np.uint16)
 
-                    # calculate orbit and update data
-                    z = self.pixel2complex(re, im)
-                    data[im, re] = self.if_in_julia_set(c_constant, z)
+            # calculate orbits once for the fixed const
+            # (saved and restored around the call)
+            saved_const = self.const
+            self.const = c_constant
+            if not self._render_orbits_fast(data):
+                self.if_in_julia_set_vectorized(self.frame_grid(), data)
+            self.const = saved_const
 
 
             # loop through frames
@@ -798,7 +1636,7 @@ class Julia2gif(JuliaSetRenderer):
                 frames += [Image.fromarray(self.map_plt_darker((data + i)%self.max_iter, 'BuGn'), 'RGB')]
 
                 # update loading bar
-                lb.update(iteration=i+1)
+                lb.update(iteration=i+1, skip_every_other=tick)
 
         # close loading bar
         lb.close()
@@ -810,28 +1648,42 @@ class Julia2gif(JuliaSetRenderer):
 
         # initialize loading bar
         lb = LoadingBar(frames_amount)
+        # batch progress redraws: each update rewrites the whole bar to
+        # stdout, which would dominate millisecond-fast frames
+        tick = max(1, frames_amount // 100)
 
         # const value list
         const_values = self.const * np.exp(1j * np.linspace(0, 2 * np.pi, frames_amount))
 
-        frames = []
-        for i in range(frames_amount):
-            data = np.zeros((self.res_h, self.res_w), dtype=np.uint8)
-            self.const = const_values[i]
-
-            frames.append(self.render_frame(data))
-
-            lb.update(i+1)
+        # frames share no state, render them across all cores
+        # (executor.map keeps the frame order)
+        params = [(self.atractor, const_values[i], self.a, self.b, self.c, \
+                   self.maps, self.res_w, self.res_h, \
+                   (self.re_min, self.re_max, self.im_min, self.im_max), \
+                   self.max_iter, self.max_mag, 0) \
+                  for i in range(frames_amount)]
+
+        # stream finished frames straight into the encoder
+        # (spawn, not fork: workers run numba's parallel kernels, and forking
+        # a process that has numba's threading layer up hangs it at exit)
+        def frames():
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), \
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                for i, raw_frame in enumerate(executor.map(_render_gif_frame, params)):
+                    lb.update(i+1, skip_every_other=tick)
+                    yield Image.frombytes('RGB', (self.res_w, self.res_h), raw_frame)
+
+        self.save_gif_streaming(frames(), self.file_path(), frame_duration)
 
         lb.close()
 
-        frames[0].save(self.file_path(), format='GIF', append_images=frames[1:], \
-                       save_all=True, duration=frame_duration, loop=0)
-
     def render_iter(self, frames_amount:int=100, frame_duration:int=50, log_spread=True):
 
         # initialize loading bar
         lb = LoadingBar(frames_amount)
+        # batch progress redraws: each update rewrites the whole bar to
+        # stdout, which would dominate millisecond-fast frames
+        tick = max(1, frames_amount // 100)
 
         # list of max iterations
         # spread vaalues of max iter logarithmically to better see first elements
@@ -845,19 +1697,21 @@ class Julia2gif(JuliaSetRenderer):
         if log_spread: iter_list = np.logspace(log_2_max_iter_start, log_2_max_iter_end, frames_amount, False, 2, int)
         else: iter_list = np.linspace(16, 2048, frames_amount, dtype=int)
 
-        frames = []
-        for i in range(frames_amount):
-            
-            self.max_iter = iter_list[i]
+        # stream finished frames straight into the encoder
+        def frames():
+            for i in range(frames_amount):
 
-            frames.append(self.render_frame_uint16())
+                self.max_iter = iter_list[i]
 
-            lb.update(i+1)
+                yield self.render_frame_uint16()
 
-        lb.close()
+                lb.update(i+1, skip_every_other=tick)
 
-        frames[0].save(f"Julia_set_iter_{self.atractor}_res_{self.res_w}x{self.res_h}.gif", format='GIF', append_images=frames[1:], \
-                        save_all=True, duration=frame_duration, loop=0)
+        self.save_gif_streaming(frames(), \
+                                f"Julia_set_iter_{self.atractor}_res_{self.res_w}x{self.res_h}.gif", \
+                                frame_duration)
+
+        lb.close()
 
     # TODO:
     # - problem with spacing ranges (seems jumpy, but maybe it's just the way it is displayed on my machine)
@@ -869,8 +1723,11 @@ class Julia2gif(JuliaSetRenderer):
 
         # initialize loading bar
         lb = LoadingBar(frames_amount)
+        # batch progress redraws: each update rewrites the whole bar to
+        # stdout, which would dominate millisecond-fast frames
+        tick = max(1, frames_amount // 100)
 
-        # helper variables        
+        # helper variables
         step = np.logspace(0, 1, frames_amount, base=10000)
         step_sum = sum(step)
         step = (step / step_sum)[::-1]
@@ -878,34 +1735,40 @@ class Julia2gif(JuliaSetRenderer):
         zoom_factor_re_max = (end_range[1] - start_range[1])
         zoom_factor_im_min = (end_range[2] - start_range[2])
         zoom_factor_im_max = (end_range[3] - start_range[3])
-        self.re_min, self.re_max, self.im_min, self.im_max = start_range
+        # accumulated steps give every frame its range up front
+        # (the serial loop used to sum them one frame at a time)
+        zoomed = np.cumsum(step)
+
+        # frames share no state, render them across all cores
+        # (executor.map keeps the frame order)
+        params = [(self.atractor, self.const, self.a, self.b, self.c, \
+                   self.maps, self.res_w, self.res_h, \
+                   (start_range[0] + zoom_factor_re_min * zoomed[i], \
+                    start_range[1] + zoom_factor_re_max * zoomed[i], \
+                    start_range[2] + zoom_factor_im_min * zoomed[i], \
+                    start_range[3] + zoom_factor_im_max * zoomed[i]), \
+                   self.max_iter, self.max_mag, 0) \
+                  for i in range(frames_amount)]
+
+        # stream finished frames straight into the encoder
+        # (spawn, not fork: workers run numba's parallel kernels, and forking
+        # a process that has numba's threading layer up hangs it at exit)
+        def frames():
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), \
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                for i, raw_frame in enumerate(executor.map(_render_gif_frame, params)):
+                    lb.update(iteration=i+1, skip_every_other=tick)
+                    yield Image.frombytes('RGB', (self.res_w, self.res_h), raw_frame)
 
-        # loop through frames
-        frames = []
-        for i in range(frames_amount):
-
-            # initialize data to zeros
-            data = np.zeros((self.res_h, self.res_w), dtype=np.uint8)
-
-            # update range
-            self.re_min += zoom_factor_re_min * step[i]
-            self.re_max += zoom_factor_re_max * step[i]
-            self.im_min += zoom_factor_im_min * step[i]
-            self.im_max += zoom_factor_im_max * step[i]
-
-            # render frame
-            frames.append(self.render_frame(data))
+        # save frames to .gif file
+        self.save_gif_streaming(frames(), self.file_path(), frame_duration)
 
-            # update loading bar
-            lb.update(iteration=i+1)
+        # leave the renderer on the last frame's range like the serial loop did
+        self.re_min, self.re_max, self.im_min, self.im_max = params[-1][8]
 
         # close loading bar
         lb.close()
 
-        # save frames to .gif file
-        frames[0].save(self.file_path(), format='GIF', append_images=frames[1:], \
-                       save_all=True, duration=frame_duration, loop=0)
-
     # TODO:
     # - refactoring (vectorize if possible)
     # Renders sideway slide with color shift and const value shift effect
@@ -941,43 +1804,75 @@ class Julia2gif(JuliaSetRenderer):
 
         # initialize loading bar
         lb = LoadingBar(frames_amount)
+        # batch progress redraws: each update rewrites the whole bar to
+        # stdout, which would dominate millisecond-fast frames
+        tick = max(1, frames_amount // 100)
         
         # helper variables
-        # 1D array of ranges starting from start_range and ending slide_amount * 2Pi further
-        ranges = np.linspace(start_range, \
-                            (start_range[0] + slide_amount*2*np.pi, start_range[1] + \
-                             slide_amount*2*np.pi, start_range[2], start_range[3]), \
-                            frames_amount)
+        # frame index, the segment each frame belongs to
+        # and its position inside that segment
+        k = np.arange(frames_amount)
+        seg = k // fourth_frames
+        t = (k % fourth_frames) / fourth_frames
+        # 1D array of slides from 0 to slide_amount * 2Pi
+        slide = slide_amount * 2 * np.pi * k / (frames_amount - 1)
         # 1D array of color shifts from 0 to 256
         color_shift = np.linspace(0, self.max_iter, frames_amount)
-        # 1D array of smooth const shifts 
+        # 1D array of smooth const shifts
         # from const_list[0] to const_list[1] to const_list[2] to const_list[3] and so on.., than back to const_list[0]
-        #spaced = tuple(np.vectorize(self.dense2less_dense2dense_distribiuion)(const_list[i], const_list[(i+1) % (segments-1)], fourth_frames + 1) for i in range(0, len(const_list)))
-        spaced = tuple(np.linspace(const_list[i], const_list[(i+1) % (segments-1)], fourth_frames + 1) for i in range(0, len(const_list)))
-        const_step = np.concatenate(spaced)
-        
+        # (one broadcasted complex lerp instead of per-segment linspaces,
+        #  wrapping through every point of const_list)
+        c_points = np.asarray(const_list, dtype=complex)
+        const_step = c_points[seg] * (1 - t) + c_points[(seg + 1) % segments] * t
+
+        # frames share no state, render them across all cores
+        # (executor.map keeps the frame order)
+        params = [(self.atractor, const_step[i], self.a, self.b, self.c, \
+                   self.maps, self.res_w, self.res_h, \
+                   (start_range[0] + slide[i], start_range[1] + slide[i], \
+                    start_range[2], start_range[3]), \
+                   self.max_iter, self.max_mag, color_shift[i]) \
+                  for i in range(frames_amount)]
+
+        # leave the renderer on the last frame's parameters like the serial
+        # loop did (the .gif file name derives from the final const)
+        self.const = const_step[frames_amount-1]
+        self.re_min, self.re_max, self.im_min, self.im_max = params[-1][8]
+
+        # stream finished frames straight into the encoder
+        # (spawn, not fork: workers run numba's parallel kernels, and forking
+        # a process that has numba's threading layer up hangs it at exit)
+        def frames():
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), \
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                for i, raw_frame in enumerate(executor.map(_render_gif_frame, params)):
+                    lb.update(iteration=i+1, skip_every_other=tick)
+                    yield Image.frombytes('RGB', (self.res_w, self.res_h), raw_frame)
 
-        # loop through frames
-        frames = []
-        for i, curr_range in enumerate(ranges):
+        # save frames to .gif file
+        self.save_gif_streaming(frames(), self.file_path(), frame_duration)
 
-            # update const and range
-            self.const = const_step[i]
-            self.re_min, self.re_max, self.im_min, self.im_max = curr_range
+        # close loading bar
+        lb.close()
 
-            # render frame
-            frame = self.render_frame(np.zeros((self.res_h, self.res_w), dtype=np.uint8), color_shift[i])
-            frames.append(frame)
 
-            # update loading bar
-            lb.update(iteration=i+1)
+# Renders one animation frame in a worker process
+# (top-level function so ProcessPoolExecutor can pickle it)
+def _render_gif_frame(params:tuple) -> bytes:
+    '''
+    Builds a lightweight renderer from the passed parameter tuple and
+    returns the finished frame as raw RGB bytes
+    (raw bytes travel between processes cheaper than PIL Images).
+    '''
+    atractor, const, a, b, c, maps, res_w, res_h, range, max_iter, max_mag, color_shift = params
 
-        # close loading bar
-        lb.close()
+    renderer = Julia2gif(atractor, const, a, b, c, maps, \
+                         res_w, res_h, range, max_iter, max_mag)
+    data = np.zeros((res_h, res_w), dtype=np.uint16)
 
-        # save frames to .gif file
-        frames[0].save(self.file_path(), format='GIF', append_images=frames[1:], \
-                       save_all=True, duration=frame_duration, loop=0)
+    if color_shift:
+        return renderer.render_frame_slide(data, color_shift).tobytes()
+    return renderer.render_frame(data).tobytes()
 
 
 # RENDERING JULIA SETS AND RETURNING IT AS AN ARRAY
@@ -61,6 +61,8 @@
 # by Wojciech Kośnik-Kowalczuk (WKK)
 
 import shutil
+import signal
+import sys
 import time
 
 class LoadingBar():
@@ -84,17 +86,36 @@ class LoadingBar():
         self._total = total
         self._start = time.time()
         self._percentage = 0
+        self._last_draw = 0.0
+
+        # cache terminal width - get_terminal_size() makes an ioctl syscall,
+        # too costly to repeat when update fires thousands of times;
+        # refresh the cache when the window gets resized instead
+        self._term_w = shutil.get_terminal_size()[0]
+        self._updates = 0
+        self._bar_cache = {}
+        try:
+            signal.signal(signal.SIGWINCH, self._on_resize)
+            self._sigwinch = True
+        except (AttributeError, ValueError):
+            # no SIGWINCH (windows) or not in the main thread -
+            # update refreshes the width every 64 calls instead
+            self._sigwinch = False
 
         # prepare loading bar
         percent_string = f"| 0% |"
         info_string = f"| 0/{self._total} | " + \
                     ((additional_info + " | ") if additional_info else '') + \
                     f"Avgerage | Estimated |"
-        loading_bar_size = shutil.get_terminal_size()[0] - len(info_string) - 9
+        loading_bar_size = self._term_w - len(info_string) - 9
         
         # display empty loading bar
         print('\r' + percent_string + self._EMPTY_BAR_CHAR * loading_bar_size + info_string, end='')
 
+    def _on_resize(self, signum, frame) -> None:
+        '''Refreshes the cached terminal width when the window gets resized.'''
+        self._term_w = shutil.get_terminal_size()[0]
+
     def update(self, iteration:int, additional_info:str=None, skip_every_other:int=0) -> int:
         '''Updates the loading bar.
 
@@ -107,45 +128,68 @@ class LoadingBar():
         Returns:
         - percentage (skipping percentages if skip_every_other is set).
         '''
-        # skip every other iteration
-        if not skip_every_other or (skip_every_other and iteration%skip_every_other == 0):
-
-            # initialize nmerical variables
-            current_time = time.time()
-            self._percentage = int(iteration/self._total * 100)
-            average_time = (current_time - self._start) / iteration
-            estimated_time = average_time * (self._total - iteration)
-
-            # set time unit for average_time
-            if average_time > 59: # > min
-                average_time_string = f"Avg = {average_time/60:.0f}min | "
-            elif average_time > 1: # > s
-                average_time_string = f"Avg = {average_time:.0f}s | "
-            else: # average_time < 1: # < s
-                average_time_string = f"Avg = {average_time*1000:.0f}ms | "
-
-            # set time unit for estimated_time
-            if estimated_time > 3599: # > hour
-                estimated_time_string = f"Est = {estimated_time/3600:.0f}h | "
-            elif estimated_time > 59: # > min
-                estimated_time_string = f"Est = {estimated_time/60:.0f}min | "
-            else: # estimated_time < 60:
-                estimated_time_string = f"Est = {estimated_time:.0f}s | "
-            
-            # initialize strings
-            percent_string = f"| {self._percentage}% |"
-            info_string = f"| {iteration}/{self._total} | " + \
-                        ((additional_info + " | ") if additional_info else '') + \
-                        average_time_string + estimated_time_string
-
-            # initialize size
-            loading_bar_size = shutil.get_terminal_size()[0] - len(percent_string) - len(info_string) - 1
-
-            # print all
-            print("\r" + percent_string + \
-                    self._PROGRESS_BAR_CHAR * (int(self._percentage / 100 * loading_bar_size)) + \
-                    self._EMPTY_BAR_CHAR * (int((100 - self._percentage) / 100 * loading_bar_size)) + \
-                    info_string, end='')
+        # keep the percentage current even when the draw is skipped
+        # (integer arithmetic - no float divide plus int() truncation)
+        self._percentage = iteration * 100 // self._total
+
+        # skip every other iteration and throttle redraws to ~30 Hz -
+        # the terminal cannot refresh faster and every draw costs writes,
+        # so on fast loops almost all calls return after this check
+        # (the final iteration always draws, so the bar ends on 100%)
+        now = time.monotonic()
+        if (skip_every_other and iteration % skip_every_other != 0) or \
+           (now - self._last_draw < 0.033 and iteration != self._total):
+            return self._percentage
+        self._last_draw = now
+
+        # initialize nmerical variables
+        current_time = time.time()
+        average_time = (current_time - self._start) / iteration
+        estimated_time = average_time * (self._total - iteration)
+
+        # set time unit for average_time
+        if average_time > 59: # > min
+            average_time_string = f"Avg = {average_time/60:.0f}min | "
+        elif average_time > 1: # > s
+            average_time_string = f"Avg = {average_time:.0f}s | "
+        else: # average_time < 1: # < s
+            average_time_string = f"Avg = {average_time*1000:.0f}ms | "
+
+        # set time unit for estimated_time
+        if estimated_time > 3599: # > hour
+            estimated_time_string = f"Est = {estimated_time/3600:.0f}h | "
+        elif estimated_time > 59: # > min
+            estimated_time_string = f"Est = {estimated_time/60:.0f}min | "
+        else: # estimated_time < 60:
+            estimated_time_string = f"Est = {estimated_time:.0f}s | "
+
+        # initialize strings
+        percent_string = f"| {self._percentage}% |"
+        info_string = f"| {iteration}/{self._total} | " + \
+                    ((additional_info + " | ") if additional_info else '') + \
+                    average_time_string + estimated_time_string
+
+        # refresh cached terminal width if window resizes go unnoticed
+        self._updates += 1
+        if not self._sigwinch and self._updates % 64 == 0:
+            self._term_w = shutil.get_terminal_size()[0]
+
+        # initialize size
+        loading_bar_size = self._term_w - len(percent_string) - len(info_string) - 1
+
+        # bar characters cached per (percentage, size) -
+        # rebuilding them every call dominates on fast iterations;
+        # filled count from one integer multiply-divide, the rest
+        # padded with ljust instead of a second multiply + concat
+        bar = self._bar_cache.get((self._percentage, loading_bar_size))
+        if bar is None:
+            filled = self._percentage * loading_bar_size // 100
+            bar = (self._PROGRESS_BAR_CHAR * filled).ljust(loading_bar_size, self._EMPTY_BAR_CHAR)
+            self._bar_cache[(self._percentage, loading_bar_size)] = bar
+
+        # print all in a single write
+        sys.stdout.write("\r" + percent_string + bar + info_string)
+        sys.stdout.flush()
 
         return self._percentage
 
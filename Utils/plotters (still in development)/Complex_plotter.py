@@ -15,6 +15,91 @@ import pygame
 import sys
 import math
 import numpy as np
+from collections import OrderedDict
+from numba import njit, prange
+from numba import cuda
+
+# check once at import whether a CUDA capable GPU is usable
+try: CUDA_AVAILABLE = cuda.is_available()
+except cuda.CudaSupportError: CUDA_AVAILABLE = False
+
+# fblits (pygame-ce) dispatches a batch of blits through the FASTCALL convention,
+# regular pygame only has the slightly slower blits
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# cache of rasterized tick labels keyed by (text, color)
+# (Font.render is one of the slowest pygame calls, so each label is rasterized only once)
+_label_cache = {}
+
+
+# RENDERING KERNEL
+# Compiled outside of the class so numba can cache the machine code between runs
+@njit(parallel=True, fastmath=True, cache=True)
+def render_julia(out, re_min, re_max, im_min, im_max, c_re, c_im, max_iter):
+    '''
+    Fills out with escape-time iteration counts of the atractor f(z) = z² + c.
+
+    Operates on passed out array !!!
+
+    Arguments:
+    - out (np.array of uint8, shape (height, width)): preallocated iteration-count buffer
+    - re_min, re_max, im_min, im_max (float): range of the complex plane to be plotted
+    - c_re, c_im (float): constant coefficient of atractor
+    - max_iter (int): maximum amount of iterations
+    '''
+    height, width = out.shape
+
+    # rows are independent, so they are distributed across cores
+    for y in prange(height):
+        # same affine mapping as screen_to_complex
+        im_z = im_max - (y / height) * (im_max - im_min)
+        for x in range(width):
+            re_z = (x / width) * (re_max - re_min) + re_min
+
+            # iterate till exceeding magnitude 2 or max_iter if not exceeded
+            zr, zi = re_z, im_z
+            count = 0
+            for _ in range(max_iter):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 > 4.0:
+                    break
+                zi = 2.0 * zr * zi + c_im
+                zr = zr2 - zi2 + c_re
+                count += 1
+            out[y, x] = count
+
+
+# GPU variant of render_julia, one thread per pixel
+# (defined only when a CUDA capable GPU is present, cuda.jit would fail otherwise)
+if CUDA_AVAILABLE:
+    @cuda.jit
+    def render_julia_cuda(out, re_min, re_max, im_min, im_max, c_re, c_im, max_iter):
+        '''
+        Fills device array out with escape-time iteration counts of f(z) = z² + c.
+        Launch with a 2D grid covering the (height, width) shape of out.
+        '''
+        x, y = cuda.grid(2)
+        height, width = out.shape
+        if x >= width or y >= height:
+            return
+
+        # same affine mapping as screen_to_complex
+        im_z = im_max - (y / height) * (im_max - im_min)
+        re_z = (x / width) * (re_max - re_min) + re_min
+
+        # iterate till exceeding magnitude 2 or max_iter if not exceeded
+        zr, zi = re_z, im_z
+        count = 0
+        for _ in range(max_iter):
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                break
+            zi = 2.0 * zr * zi + c_im
+            zr = zr2 - zi2 + c_re
+            count += 1
+        out[y, x] = count
 
 
 # MAIN CLASS
@@ -54,6 +139,10 @@ class PLOTTER():
     - axes_color (tuple): Color of the axes.
     - show_axes (bool): Flag indicating whether the axes are visible.
     - axes_surface (Surface): Surface for rendering axes.
+    - const (complex): Constant coefficient of the atractor.
+    - iterations (np.array): Preallocated iteration-count buffer.
+    - palette (np.array): LUT mapping iteration counts to RGB colors.
+    - fractal_surface (Surface): Cached surface with the rendered fractal.
 
     Methods:
 
@@ -65,13 +154,19 @@ class PLOTTER():
     - initialize_window(): Initialize Pygame module and prepare window.
     - initialize_text(): Initialize fonts and text.
     - initialize_optionBar_and_axes(): Initialize option bar and axes.
+    - initialize_fractal(): Initialize fractal rendering buffers.
     - process_arguments(): Parses command line arguments.
 
     Helper functions:
     - draw_optionBar(): Draws option bar and updates it's position.
+    - build_tick_strips(): Pre-builds the tick mark strips for the current resolution.
     - draw_axes_surface(): Draws axes and returns axes surface.
+    - render_label(): Returns a rasterized tick label, rendering it only on cache miss.
+    - draw_fractal_surface(): Renders the atractor into a pygame surface.
     - toggle_fullscreen(): Toggle fullscreen mode.
     - zoom_around_given_point(): Adjusts given range for zooming.
+    - complex_to_screen_batch(): Maps arrays of complex numbers to screen coordinates.
+    - update_screen_mapping(): Precomputes the affine complex -> screen mapping factors.
     """
 
     # Constants
@@ -80,33 +175,42 @@ class PLOTTER():
     OPTION_BAR_SPEED_OF_SLIDING = 8
     WINDOW_NAME = "Complex plotter"
     WINDOW_SIZE = (800, 1500)
+    MAX_ITER = 100
 
 
     # MAIN LOOP
     # pygmame window loop
-    def draw_window(self, image_generator: callable) -> None:
+    def draw_window(self) -> None:
+
+        # Clock for capping the frame rate (keeps idle CPU usage down)
+        clock = pygame.time.Clock()
+
+        # Dirty flag - the screen is only redrawn and flipped after something changed
+        dirty = True
 
         # Main loop
         while True:
 
             # Interaction with user
             for event in pygame.event.get():
-                
+
                 # Exit window
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
-                
+
                 # Keyboard
                 if event.type == pygame.KEYDOWN:
 
                     # Toggle fullscreen by ressing F11 key
                     if event.key == pygame.K_F11:
                         self.toggle_fullscreen()
+                        dirty = True
 
                     # Toggle option bar
-                    if event.key == pygame.K_o: 
+                    if event.key == pygame.K_o:
                         self.optionBar_toggle = not self.optionBar_toggle
+                        dirty = True
 
                     # Closing with ESC key
                     if event.key == pygame.K_ESCAPE:
@@ -116,11 +220,14 @@ class PLOTTER():
                     # Changing axes color
                     if event.key == pygame.K_c:
                         self.axes_color = (0,0,0) if self.axes_color != (0,0,0) else (255,255,255)
+                        self.build_tick_strips() # strips bake in the color
                         self.axes_surface = self.draw_axes_surface()
+                        dirty = True
 
                     # Show/hide axes
                     if event.key == pygame.K_a:
                         self.show_axes = not self.show_axes
+                        dirty = True
 
                 # Zoom range using mouse scroll
                 if event.type == pygame.MOUSEBUTTONDOWN:
@@ -128,30 +235,45 @@ class PLOTTER():
                     # Zoom in
                     if event.button == 4: # scroll up
                         self.plane_range = self.zoom_around_given_point(pygame.mouse.get_pos(), 1.1)
+                        self.update_screen_mapping()
                         self.axes_surface = self.draw_axes_surface()
+                        self.fractal_surface = None # force fractal re-render
+                        dirty = True
 
                     # Zoom out
                     if event.button == 5: # scroll down
                         self.plane_range = self.zoom_around_given_point(pygame.mouse.get_pos(), 1/1.1)
+                        self.update_screen_mapping()
                         self.axes_surface = self.draw_axes_surface()
-                    
+                        self.fractal_surface = None # force fractal re-render
+                        dirty = True
+
+            # Option bar mid-slide keeps changing the screen without any event
+            optionBar_target = self.screen_width - self.OPTION_BAR_WIDTH if self.optionBar_toggle else self.screen_width
+            if self.optionBar_pos != optionBar_target:
+                dirty = True
 
-            self.screen.fill((0,0,0))
-            # Draw something for demonstration (e.g., a red rectangle)
-            #pygame.draw.rect(self.screen, (255, 0, 0), (100, 100, self.screen_width-200, self.screen_height-200))
-            # Draw image
-            img = image_generator(*self.plane_range, 100, 100)
-            img = (img / np.max(img) * 255).astype(np.uint8)
-            img_surface = pygame.image.frombuffer(img.tobytes(), (100, 100), 'P')
-            self.screen.blit(img_surface, (0,0))
+            # Redraw and flip only when something changed, idle frames cost nothing
+            if dirty:
+                self.screen.fill((0,0,0))
+                # Draw fractal (cached surface, re-rendered only on zoom/resize)
+                if self.fractal_surface is None:
+                    self.fractal_surface = self.draw_fractal_surface()
+                self.screen.blit(self.fractal_surface, (0,0))
 
-            # Axes
-            if self.show_axes: self.screen.blit(self.axes_surface, (0,0))
-            # Option bar
-            self.draw_optionBar()
+                # Axes (also skipped when both axes lie outside of the plotted range)
+                re_min, re_max, im_min, im_max = self.plane_range
+                if self.show_axes and (re_min <= 0 <= re_max or im_min <= 0 <= im_max):
+                    self.screen.blit(self.axes_surface, (0,0))
+                # Option bar
+                self.draw_optionBar()
 
-            # Update the display
-            pygame.display.flip()
+                # Update the display
+                pygame.display.flip()
+                dirty = False
+
+            # Cap the frame rate
+            clock.tick(60)
 
 
     # CONSTRUCTOR
@@ -163,7 +285,8 @@ class PLOTTER():
         self.initialize_window()
         self.initialize_text()
         self.initialize_optionBar_and_axes()
-    
+        self.initialize_fractal()
+
     # Initialize Pygame module and prepare window
     def initialize_window(self):
         '''Initialize Pygame module and prepare window'''
@@ -206,7 +329,9 @@ class PLOTTER():
                                     'PARAMETERS:',
                                     'Atractor:   ' + self.acttractor_str,
                                     'Range: ']
-        self.option_bar_descriptiion = [self.option_bar_font_text.render(t, True, (0,0,0)) for t in self.option_bar_description_txt]
+        self.option_bar_descriptiion = [self.option_bar_font_text.render(t, True, (0,0,0)).convert_alpha() for t in self.option_bar_description_txt]
+        # blit offsets relative to the bar position, layout is fixed so computed only once
+        self.option_bar_blit_offsets = [(16, 140 + index * 50) for index in range(len(self.option_bar_descriptiion))]
 
         self.axes_font_numbers = pygame.font.Font(None, 25)
         self.axes_font_names = pygame.font.Font(None, 65)
@@ -215,16 +340,44 @@ class PLOTTER():
     def initialize_optionBar_and_axes(self):
         '''Initialize option bar and axes'''
 
+        # Complex -> screen mapping factors (must exist before the first axes draw)
+        self.update_screen_mapping()
+
         # Option bar
         self.optionBar_height = self.fullscreen_height # size of option bar
         self.optionBar_pos = self.fullscreen_width # starting position of side bar (off-window)
         self.optionBar_toggle = True
+        # translucent bar background, allocated and filled once, reused every frame
+        self.optionBar_surface = pygame.Surface((self.OPTION_BAR_WIDTH, self.screen_height), pygame.SRCALPHA).convert_alpha()
+        self.optionBar_surface.fill((200, 200, 200, 160)) # (R, G, B, alpha)
 
         # Axes
         self.axes_color = (255, 255, 255)
         self.show_axes = True
+        self.axes_surface = None
+        # small LRU of rendered axes surfaces, fullscreen toggles and
+        # zoom sequences that revisit a range get their axes back for free
+        self.axes_cache = OrderedDict()
+        self.build_tick_strips()
         self.axes_surface = self.draw_axes_surface()
-    
+
+    # Initialize fractal rendering buffers
+    def initialize_fractal(self):
+        '''Initialize fractal rendering buffers, palette and cached surface'''
+
+        # preallocated iteration-count buffer, reused across renders
+        self.iterations = np.empty((self.screen_height, self.screen_width), dtype=np.uint8)
+
+        # device-side buffer for the CUDA backend, allocated once and reused
+        self.iterations_device = cuda.device_array_like(self.iterations) if CUDA_AVAILABLE else None
+
+        # palette LUT mapping iteration count to RGB (indexed with the iteration buffer)
+        ramp = np.linspace(0, 255, self.MAX_ITER + 1).astype(np.uint8)
+        self.palette = np.stack((ramp, ramp // 2, 255 - ramp), axis=1)
+
+        # rendered lazily in draw_window, reset to None to force re-render
+        self.fractal_surface = None
+
     # Parses command line arguments
     def process_arguments(self) -> tuple:
         '''
@@ -247,6 +400,8 @@ class PLOTTER():
         except: raise ValueError("Arguments 1 to 6 must be numbers")
 
         # get atracor
+        try: self.const = complex(sys.argv[5])
+        except ValueError: raise ValueError("Argument 5 must be a complex number")
         self.acttractor_str = 'f(z) = z² + ' + sys.argv[5] # change to the regular expression later
 
 
@@ -263,33 +418,80 @@ class PLOTTER():
         elif not self.optionBar_toggle and self.optionBar_pos < self.screen_width:
             self.optionBar_pos += self.OPTION_BAR_SPEED_OF_SLIDING
 
+        # Bar fully slid off-window - skip all blits instead of letting SDL clip them to zero
+        if self.optionBar_pos >= self.screen_width:
+            return
+
         # Add option bar surface to screen surface
-        surf = pygame.Surface((self.OPTION_BAR_WIDTH, self.screen_height), pygame.SRCALPHA)
-        surf.fill((200, 200, 200, 160))  # (R, G, B, alpha)
-        self.screen.blit(surf, (self.optionBar_pos, 0))
+        self.screen.blit(self.optionBar_surface, (self.optionBar_pos, 0))
 
         # Show options
         if self.optionBar_pos < self.screen_width - self.OPTION_BAR_WIDTH + self.OPTION_BAR_SPEED_OF_SLIDING:
             self.screen.blit(self.option_bar_title, (self.optionBar_pos + 45, 45))
-            for index, t in enumerate(self.option_bar_descriptiion):
-                self.screen.blit(t, (self.optionBar_pos + 16, 140 + index * 50))
+            # batch all description blits into a single call
+            description_blits = [(t, (self.optionBar_pos + dx, dy))
+                                 for t, (dx, dy) in zip(self.option_bar_descriptiion, self.option_bar_blit_offsets)]
+            if HAS_FBLITS: self.screen.fblits(description_blits, 0)
+            else: self.screen.blits(description_blits)
+
+    # Pre-builds the tick mark strips for the current resolution
+    def build_tick_strips(self) -> None:
+        '''
+        Pre-builds one horizontal and one vertical strip of tick marks.
+        Tick screen positions do not depend on the plane range (the range
+        endpoints always map to the screen edges), so the strips only need
+        rebuilding when the resolution changes, draw_axes_surface then
+        just blits them at the axis offsets.
+        '''
+
+        # Horizontal strip of vertical ticks (for the real axis)
+        self.tick_strip_h = pygame.Surface((self.screen_width, 10), pygame.SRCALPHA)
+        # Vertical strip of horizontal ticks (for the imaginary axis)
+        self.tick_strip_v = pygame.Surface((10, self.screen_height), pygame.SRCALPHA)
+
+        # excluding ticks on the edges (same layout as the labels loop)
+        for t in range(1, self.NUM_OF_TICKS - 1):
+            x = int(t * self.screen_width / (self.NUM_OF_TICKS - 1))
+            y = int(t * self.screen_height / (self.NUM_OF_TICKS - 1))
+            pygame.draw.line(self.tick_strip_h, self.axes_color, (x, 0), (x, 10), 2)
+            pygame.draw.line(self.tick_strip_v, self.axes_color, (0, y), (10, y), 2)
 
     # Draws axes and returns axes surface
     def draw_axes_surface(self) -> object:
         '''Draws axes and returns axes surface'''
 
-        # Create axes surface
-        axes_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA) 
-
         # Unpack plane range
         re_min, re_max, im_min, im_max = self.plane_range
 
-        # Real axis
+        # Calculate tick intervals and precision based on plane_range
+        x_tick_interval = (re_max - re_min) / (self.NUM_OF_TICKS - 1)
+        y_tick_interval = (im_max - im_min) / (self.NUM_OF_TICKS - 1)
+        order_of_magnitude_re = self.order_of_magnitude(x_tick_interval)
+        order_of_magnitude_im = self.order_of_magnitude(y_tick_interval)
+
+        # Skip the rebuild when this exact view was already rendered,
+        # identical plane ranges produce identical axes
+        cache_key = (self.plane_range, self.axes_color,
+                     self.screen_width, self.screen_height)
+        cached = self.axes_cache.get(cache_key)
+        if cached is not None:
+            self.axes_cache.move_to_end(cache_key) # mark as freshly used
+            return cached
+
+        # Create axes surface
+        axes_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+
+        # Screen position of the axes straight from the mapping factors,
+        # the scalar complex_to_screen is only left for mouse callbacks
+        axis_x = int(self.map_ox) # screen x of the imaginary axis
+        axis_y = int(self.map_oy) # screen y of the real axis
+
+        # Real axis (re_min maps to x=0 and re_max to x=screen_width)
         pygame.draw.line(
             axes_surface,
             self.axes_color,
-            self.complex_to_screen(re_min, 0),
-            self.complex_to_screen(re_max, 0),
+            (0, axis_y),
+            (self.screen_width, axis_y),
             2
         )
 
@@ -297,66 +499,92 @@ class PLOTTER():
         pygame.draw.line(
             axes_surface,
             self.axes_color,
-            self.complex_to_screen(0, im_min),
-            self.complex_to_screen(0, im_max),
+            (axis_x, 0),
+            (axis_x, self.screen_height),
             2
         )
 
-        # Calculate tick intervals and precision based on plane_range
-        x_tick_interval = (re_max - re_min) / (self.NUM_OF_TICKS - 1)
-        y_tick_interval = (im_max - im_min) / (self.NUM_OF_TICKS - 1)
-        order_of_magnitude_re = self.order_of_magnitude(x_tick_interval)
-        order_of_magnitude_im = self.order_of_magnitude(y_tick_interval)
+        # Calculate pixel coordinates of all ticks in one batched call
+        ticks_re = np.linspace(re_min, re_max, self.NUM_OF_TICKS)
+        ticks_im = np.linspace(im_min, im_max, self.NUM_OF_TICKS)
+        ticks_x, ticks_y = self.complex_to_screen_batch(ticks_re, ticks_im)
+
+        # Tick positions on screen are uniform at every zoom, so both whole
+        # rows of tick marks come from the strips pre-built per resolution,
+        # only the numeric labels are still per-view work
+        label_blits = [
+            (self.tick_strip_h, (0, axis_y - 5)),
+            (self.tick_strip_v, (axis_x - 5, 0)),
+        ]
 
-        # Calculate tick placement and draw them
-        ticks_placement_re = ()
-        ticks_placement_im = ()
+        # Collect number labels for the same batched blit
         for t in range(self.NUM_OF_TICKS - 1):
-            
+
             # Real
-            # Draw ticks
-            tick_re = re_min + t * x_tick_interval
-            ticks_placement_re = self.complex_to_screen(tick_re, 0)
-            # if statement excludes tick on the edge
-            if t > 0:
-                pygame.draw.line(
-                    axes_surface,
-                    self.axes_color,
-                    (ticks_placement_re[0], ticks_placement_re[1] - 5),
-                    (ticks_placement_re[0], ticks_placement_re[1] + 5),
-                    2
-                )
-            # Draw numbers
+            x = int(ticks_x[t])
             # if statement excludes 0 to avoid overlapping with other axis
-            if ticks_placement_re[0]:
-                axes_surface.blit(
-                    self.axes_font_numbers.render(str(round(tick_re, 1 - order_of_magnitude_re)), True, self.axes_color),
-                    (ticks_placement_re[0] - 5, ticks_placement_re[1] - 30)
-                )
+            if x:
+                label_blits.append((
+                    self.render_label(str(round(float(ticks_re[t]), 1 - order_of_magnitude_re))),
+                    (x - 5, axis_y - 30)
+                ))
 
             # Imaginary
-            # Draw ticks
-            tick_im = im_min + t * y_tick_interval
-            ticks_placement_im = self.complex_to_screen(0, tick_im)
-            if t > 0:
-                pygame.draw.line(
-                    axes_surface,
-                    self.axes_color,
-                    (ticks_placement_im[0] - 5, ticks_placement_im[1]),
-                    (ticks_placement_im[0] + 5, ticks_placement_im[1]),
-                    2
-                )
-            # Draw numbers
-            if ticks_placement_im[0]:
-                axes_surface.blit(
-                    self.axes_font_numbers.render(str(round(tick_im, 1 - order_of_magnitude_im)) + ' i', True,
-                                                self.axes_color),
-                    (ticks_placement_im[0] + 13, ticks_placement_im[1] - 7)
-                )
-
-        
+            y = int(ticks_y[t])
+            if axis_x:
+                label_blits.append((
+                    self.render_label(str(round(float(ticks_im[t]), 1 - order_of_magnitude_im)) + ' i'),
+                    (axis_x + 13, y - 7)
+                ))
+
+        # Blit all ticks and number labels in a single call
+        if HAS_FBLITS: axes_surface.fblits(label_blits, 0)
+        else: axes_surface.blits(label_blits)
+
+        # convert once for faster blitting in the main loop
+        axes_surface = axes_surface.convert_alpha()
+
+        # store in the LRU, evicting the least recently used entry
+        self.axes_cache[cache_key] = axes_surface
+        if len(self.axes_cache) > 8:
+            self.axes_cache.popitem(last=False)
+
         return axes_surface
 
+    # Returns a rasterized tick label, rendering it only on cache miss
+    def render_label(self, text: str) -> object:
+        '''Returns cached surface with rendered label, rasterizes it on first use'''
+        key = (text, self.axes_color)
+        surface = _label_cache.get(key)
+        if surface is None:
+            # keep the cache bounded, deep zoom sessions produce endless new labels
+            if len(_label_cache) >= 1024:
+                _label_cache.pop(next(iter(_label_cache))) # drop the oldest entry
+            surface = self.axes_font_numbers.render(text, True, self.axes_color)
+            _label_cache[key] = surface
+        return surface
+
+    # Renders the atractor into a pygame surface
+    def draw_fractal_surface(self) -> object:
+        '''Renders the atractor into a pygame surface using the compiled kernel'''
+
+        # calculate iteration counts (in-place, buffers are preallocated)
+        # GPU backend: one thread per pixel, fall back to the CPU kernel without CUDA
+        if CUDA_AVAILABLE:
+            threads_per_block = (16, 16)
+            blocks_per_grid = ((self.screen_width + 15) // 16, (self.screen_height + 15) // 16)
+            render_julia_cuda[blocks_per_grid, threads_per_block](
+                self.iterations_device, *self.plane_range,
+                self.const.real, self.const.imag, self.MAX_ITER)
+            self.iterations_device.copy_to_host(self.iterations)
+        else:
+            render_julia(self.iterations, *self.plane_range, self.const.real, self.const.imag, self.MAX_ITER)
+
+        # map iteration counts to colors and wrap into a surface
+        # (surfarray expects (width, height, 3), buffer is (height, width))
+        rgb = self.palette[self.iterations]
+        return pygame.surfarray.make_surface(rgb.transpose(1, 0, 2))
+
     # Toggle fullscreen mode
     def toggle_fullscreen(self):
         '''Toggle fullscreen mode'''
@@ -366,7 +594,13 @@ class PLOTTER():
         self.screen_width = self.fullscreen_width if self.is_fullscreen else self.windowscreen_width
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), self.flags)
         self.optionBar_pos = self.screen_width - self.OPTION_BAR_WIDTH if self.optionBar_toggle else self.screen_width
+        self.update_screen_mapping() # factors depend on screen size
+        self.build_tick_strips() # strip length follows the screen
         self.axes_surface = self.draw_axes_surface()
+        self.initialize_fractal() # buffer size depends on screen size
+        # recreate the bar background once per resize (its height follows the screen)
+        self.optionBar_surface = pygame.Surface((self.OPTION_BAR_WIDTH, self.screen_height), pygame.SRCALPHA).convert_alpha()
+        self.optionBar_surface.fill((200, 200, 200, 160)) # (R, G, B, alpha)
 
     # Adjusts given range for zooming
     def zoom_around_given_point(self, point: tuple, zoom: float) -> tuple:
@@ -399,7 +633,16 @@ class PLOTTER():
     def order_of_magnitude(self, x: float) -> int:
         '''Returns the order of magnitude of x'''
         if x == 0: return 0 # log(0) is undifined
-        return math.floor(math.log10(abs(x)))
+        # frexp extracts the base-2 exponent (a bit operation, much cheaper
+        # than the libm log10 call), log10(x) = (e-1)*log10(2) + log10(m*2)
+        m, e = math.frexp(abs(x))
+        oom = math.floor((e - 1) * 0.30102999566398120 + math.log10(m * 2))
+
+        # guard against rounding right at a power of ten
+        if 10.0 ** oom > abs(x): oom -= 1
+        elif 10.0 ** (oom + 1) <= abs(x): oom += 1
+
+        return oom
 
     # Maps complex numbers to screen coordinates (pixels)
     def complex_to_screen(self, re_z:float, im_z:float) -> tuple[int, int]:
@@ -414,13 +657,52 @@ class PLOTTER():
         tuple[int, int]: Screen coordinates (x, y).
         '''
 
+        # two multiply-adds using the factors precomputed in update_screen_mapping
+        x = int(re_z * self.map_sx + self.map_ox)
+        y = int(self.map_oy - im_z * self.map_sy)
+
+        return x, y
+
+    # Maps arrays of complex numbers to screen coordinates (pixels)
+    def complex_to_screen_batch(self, re_z: np.ndarray, im_z: np.ndarray) -> tuple:
+        '''
+        Vectorized complex_to_screen, maps whole coordinate arrays
+        with two numpy multiply-adds instead of one call per point.
+
+        Arguments:
+        - re_z (np.array): Real parts of the complex numbers.
+        - im_z (np.array): Imaginary parts of the complex numbers.
+
+        Returns:
+        tuple[np.array, np.array]: Screen coordinates (xs, ys) as int32 arrays.
+        '''
+
+        xs = (re_z * self.map_sx + self.map_ox).astype(np.int32)
+        ys = (self.map_oy - im_z * self.map_sy).astype(np.int32)
+
+        return xs, ys
+
+    # Precomputes the affine complex -> screen mapping factors
+    def update_screen_mapping(self) -> None:
+        '''
+        Precomputes the affine complex -> screen mapping factors.
+        Must be called after every plane_range or screen size change,
+        complex_to_screen reduces to two multiply-adds with them.
+        '''
+
         # Unpack plane range
         re_min, re_max, im_min, im_max = self.plane_range
 
-        x = int(((re_z - re_min) / (re_max - re_min)) * self.screen_width)
-        y = int(((im_max - im_z) / (im_max - im_min)) * self.screen_height)
+        self.map_sx = self.screen_width / (re_max - re_min)
+        self.map_ox = -re_min * self.map_sx
+        self.map_sy = self.screen_height / (im_max - im_min)
+        self.map_oy = im_max * self.map_sy
 
-        return x, y
+        # inverse factors, so screen_to_complex multiplies instead of dividing
+        self.map_isx = (re_max - re_min) / self.screen_width
+        self.map_iox = re_min
+        self.map_isy = (im_max - im_min) / self.screen_height
+        self.map_ioy = im_max
 
     # Maps screen coordinates (pixels) to complex numbers
     def screen_to_complex(self, x: int, y: int) -> tuple[float, float]:
@@ -435,11 +717,9 @@ class PLOTTER():
         tuple[float, float]: Complex numbers (real, imaginary).
         '''
 
-        # Unpack plane range
-        re_min, re_max, im_min, im_max = self.plane_range
-
-        re = (x / self.screen_width) * (re_max - re_min) + re_min
-        im = im_max - (y / self.screen_height) * (im_max - im_min)
+        # two multiply-adds using the inverse factors from update_screen_mapping
+        re = x * self.map_isx + self.map_iox
+        im = self.map_ioy - y * self.map_isy
 
         return re, im
 